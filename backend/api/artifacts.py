@@ -0,0 +1,199 @@
+import json
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from models import models, schemas
+from models.database import get_db
+from services.engine import columnar_results_path, layer_index_path
+from services.file_streaming import (
+    RangeNotSatisfiable, compress_stream, file_etag, if_range_matches, iter_file, last_modified, parse_range,
+    select_encoding
+)
+from services.layer_index import clamp_layer_range, gcode_byte_range, load_layer_index, read_previews
+
+router = APIRouter()
+
+def stream_file(path: str, request: Request, media_type: str, filename: str, compressible: bool = True) -> Response:
+    """
+    Stream a file in chunks, honouring Range requests and compressing on the fly
+
+    Range requests are always served uncompressed so byte offsets refer to the
+    file on disk; otherwise the body is zstd- or gzip-encoded if the client accepts it.
+    Each coding has its own ETag. ``If-Range`` may carry the identity ETag or
+    the Last-Modified date (see ``if_range_matches``). ``HEAD`` requests get the
+    same status and headers without a body.
+    """
+    if not path or not os.path.isfile(path):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+
+    size = os.path.getsize(path)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": file_etag(path),
+        "Last-Modified": last_modified(path),
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Vary": "Accept-Encoding"
+    }
+    head = request.method == "HEAD"
+
+    if_range = request.headers.get("if-range")
+    range_header = request.headers.get("range")
+    if if_range and not if_range_matches(if_range, path):
+        range_header = None
+
+    try:
+        byte_range = parse_range(range_header, size)
+    except RangeNotSatisfiable:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={"Content-Range": f"bytes */{size}"}
+        )
+
+    if byte_range is not None:
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        headers["Content-Length"] = str(end - start + 1)
+        return StreamingResponse(
+            iter(()) if head else iter_file(path, start, end),
+            status_code=status.HTTP_206_PARTIAL_CONTENT,
+            media_type=media_type,
+            headers=headers
+        )
+
+    encoding = select_encoding(request.headers.get("accept-encoding")) if compressible else None
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        headers["ETag"] = file_etag(path, encoding)
+    else:
+        headers["Content-Length"] = str(size)
+    return StreamingResponse(
+        iter(()) if head else compress_stream(iter_file(path), encoding),
+        media_type=media_type,
+        headers=headers
+    )
+
+def _get_toolpath_or_404(db: Session, toolpath_id: int) -> models.Toolpath:
+    toolpath = db.query(models.Toolpath).filter(models.Toolpath.id == toolpath_id).first()
+    if toolpath is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Toolpath not found")
+    return toolpath
+
+def _get_layer_index_or_409(toolpath: models.Toolpath):
+    index = load_layer_index(toolpath.file_path) if toolpath.file_path else None
+    if index is None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Toolpath has no layer index")
+    return index
+
+def _clamp_layer_range_or_400(index, start: int, end: Optional[int]):
+    try:
+        return clamp_layer_range(index, start, end)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.api_route("/toolpaths/{toolpath_id}/gcode", methods=["GET", "HEAD"])
+def download_toolpath_gcode(toolpath_id: int, request: Request, db: Session = Depends(get_db)):
+    toolpath = _get_toolpath_or_404(db, toolpath_id)
+    return stream_file(toolpath.file_path, request, "text/x-gcode", f"toolpath-{toolpath.id}.gcode")
+
+@router.api_route("/toolpaths/{toolpath_id}/index", methods=["GET", "HEAD"])
+def download_toolpath_layer_index(toolpath_id: int, request: Request, db: Session = Depends(get_db)):
+    """
+    Per-layer byte offsets into the G-code, for clients that issue their own Range requests
+    """
+    toolpath = _get_toolpath_or_404(db, toolpath_id)
+    _get_layer_index_or_409(toolpath)
+    return stream_file(layer_index_path(toolpath.file_path), request, "application/json", f"toolpath-{toolpath.id}.idx.json")
+
+@router.get("/toolpaths/{toolpath_id}/gcode/layers")
+def download_toolpath_gcode_layers(
+    toolpath_id: int,
+    request: Request,
+    start: int = Query(0, ge=0),
+    end: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db)
+):
+    """
+    Raw G-code for an inclusive layer range, read with a single seek
+    """
+    toolpath = _get_toolpath_or_404(db, toolpath_id)
+    index = _get_layer_index_or_409(toolpath)
+    start, end = _clamp_layer_range_or_400(index, start, end)
+    first_byte, last_byte = gcode_byte_range(index, start, end)
+
+    headers = {"Vary": "Accept-Encoding", "X-Layer-Range": f"{start}-{end}"}
+    encoding = select_encoding(request.headers.get("accept-encoding"))
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    else:
+        headers["Content-Length"] = str(last_byte - first_byte + 1)
+    return StreamingResponse(
+        compress_stream(iter_file(toolpath.file_path, first_byte, last_byte), encoding),
+        media_type="text/x-gcode",
+        headers=headers
+    )
+
+@router.get("/toolpaths/{toolpath_id}/layers")
+def read_toolpath_layer_previews(
+    toolpath_id: int,
+    start: int = Query(0, ge=0),
+    end: Optional[int] = Query(None, ge=0),
+    lod: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    """
+    Simplified preview polylines for an inclusive layer range at one level of detail
+    """
+    toolpath = _get_toolpath_or_404(db, toolpath_id)
+    index = _get_layer_index_or_409(toolpath)
+    tolerances = index["preview_tolerances"]
+    if lod >= len(tolerances):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Level of detail must be below {len(tolerances)}"
+        )
+    start, end = _clamp_layer_range_or_400(index, start, end)
+
+    # Preview records are stored as JSON already, so splice them in rather than re-encoding
+    header = json.dumps({
+        "toolpath_id": toolpath.id,
+        "lod": lod,
+        "tolerance": tolerances[lod],
+        "total_layers": len(index["layers"])
+    })
+    records = read_previews(toolpath.file_path, index, start, end, lod)
+    body = header[:-1].encode() + b', "layers": [' + b",".join(records) + b"]}"
+    return Response(content=body, media_type="application/json")
+
+@router.get("/blobs/{blob_hash}", response_model=schemas.Blob)
+def read_blob(blob_hash: str, db: Session = Depends(get_db)):
+    """
+    Look up stored content by SHA-256, so clients can skip uploading files the server already has
+    """
+    blob = db.query(models.Blob).filter(models.Blob.hash == blob_hash.lower()).first()
+    if blob is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Blob not found")
+    return blob
+
+@router.api_route("/simulations/{simulation_id}/results", methods=["GET", "HEAD"])
+def download_simulation_results(
+    simulation_id: int,
+    request: Request,
+    format: str = Query("json", regex="^(json|npz)$"),
+    db: Session = Depends(get_db)
+):
+    simulation = db.query(models.Simulation).filter(models.Simulation.id == simulation_id).first()
+    if simulation is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Simulation not found")
+    if not simulation.result_path:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Simulation has no results yet")
+
+    if format == "npz":
+        return stream_file(
+            columnar_results_path(simulation.result_path), request,
+            "application/octet-stream", f"simulation-{simulation.id}.npz", compressible=False
+        )
+    return stream_file(simulation.result_path, request, "application/json", f"simulation-{simulation.id}.json")
@@ -0,0 +1,123 @@
+import json
+from functools import partial
+
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from sqlalchemy.orm import Session
+
+from models import models, schemas
+from models.database import get_db
+from services.engine_jobs import cancel_thermal_job, run_slice_job, run_thermal_job
+from services.jobs import job_manager
+
+router = APIRouter()
+ws_router = APIRouter()
+
+# Bounds for the per-client delivery interval (seconds)
+MIN_EVENT_INTERVAL = 0.05
+MAX_EVENT_INTERVAL = 5.0
+
+def _get_job_or_404(job_id: str):
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return job
+
+@router.post("/slice", response_model=schemas.Job, status_code=status.HTTP_202_ACCEPTED)
+def create_slice_job(request: schemas.SliceJobCreate, db: Session = Depends(get_db)):
+    model = db.query(models.Model).filter(models.Model.id == request.model_id).first()
+    if model is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Model not found")
+
+    return job_manager.submit("slice", partial(
+        run_slice_job,
+        model_id=model.id,
+        name=request.name,
+        layer_height=request.layer_height,
+        infill_density=request.infill_density
+    ), profile=request.profile)
+
+@router.post("/thermal", response_model=schemas.Job, status_code=status.HTTP_202_ACCEPTED)
+def create_thermal_job(request: schemas.ThermalJobCreate, db: Session = Depends(get_db)):
+    toolpath = db.query(models.Toolpath).filter(models.Toolpath.id == request.toolpath_id).first()
+    if toolpath is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Toolpath not found")
+
+    simulation = models.Simulation(
+        name=request.name,
+        status="pending",
+        project_id=toolpath.project_id,
+        toolpath_id=toolpath.id
+    )
+    db.add(simulation)
+    db.commit()
+
+    return job_manager.submit("thermal", partial(
+        run_thermal_job,
+        simulation_id=simulation.id,
+        dimensions=request.dimensions,
+        resolution=request.resolution,
+        steps_per_layer=request.steps_per_layer,
+        progress_interval=request.progress_interval
+    ), profile=request.profile, on_cancel=partial(cancel_thermal_job, simulation_id=simulation.id))
+
+@router.get("/{job_id}", response_model=schemas.Job)
+def read_job(job_id: str):
+    return _get_job_or_404(job_id)
+
+@router.post("/{job_id}/cancel", response_model=schemas.Job)
+def cancel_job(job_id: str):
+    _get_job_or_404(job_id)
+    return job_manager.cancel(job_id)
+
+@router.get("/{job_id}/profile", response_class=PlainTextResponse)
+def read_job_profile(job_id: str):
+    """
+    Sampled stacks of a job submitted with ``profile`` set, in collapsed-stack
+    format (one "frame;frame;frame count" line per stack) for flame graph tools
+    """
+    job = _get_job_or_404(job_id)
+    if not job.profile:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job was not profiled")
+    if job.profile_stacks is None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Job is still running")
+    return PlainTextResponse(job.profile_stacks)
+
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    interval: float = Query(0.25, ge=MIN_EVENT_INTERVAL, le=MAX_EVENT_INTERVAL)
+):
+    """
+    Server-Sent Events stream of coalesced progress, temperature and status events
+    """
+    job = _get_job_or_404(job_id)
+
+    async def event_source():
+        async for event in job.channel.subscribe(interval):
+            yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@ws_router.websocket("/{job_id}")
+async def job_events_websocket(websocket: WebSocket, job_id: str, interval: float = 0.25):
+    """
+    WebSocket stream of the same events as the SSE endpoint
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        await websocket.close(code=4404)
+        return
+
+    await websocket.accept()
+    interval = min(max(interval, MIN_EVENT_INTERVAL), MAX_EVENT_INTERVAL)
+    try:
+        async for event in job.channel.subscribe(interval):
+            await websocket.send_json(event)
+    except WebSocketDisconnect:
+        return
+    await websocket.close()
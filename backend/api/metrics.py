@@ -0,0 +1,18 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from services.engine import instrumentation
+
+router = APIRouter()
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def read_metrics():
+    """
+    Engine phase timings and counters in the Prometheus text format
+
+    Empty unless instrumentation is enabled with ``NEXPATH_METRICS=1``.
+    """
+    return PlainTextResponse(instrumentation.registry.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,115 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from models import models, schemas
+from models.database import get_db
+from services.storage import BlobWriter, acquire_blob, blob_store, collect_garbage, release_blob
+
+router = APIRouter()
+
+def _create_model(db: Session, model: schemas.ModelCreate, digest: str, size: int,
+                  writer: Optional[BlobWriter] = None) -> Optional[models.Model]:
+    """
+    Reference the blob and create the model row
+
+    Returns None, with nothing changed, if no writer is given and the blob's
+    file is gone because it was garbage collected concurrently.
+    """
+    # The reference locks the blob row against collect_garbage, so the file
+    # can only be checked or moved into place after taking it
+    acquire_blob(db, digest, size)
+    if writer is not None:
+        writer.commit()
+    elif not blob_store.exists(digest):
+        db.rollback()
+        return None
+
+    db_model = models.Model(
+        name=model.name,
+        file_type=model.file_type,
+        project_id=model.project_id,
+        file_path=blob_store.path_for(digest),
+        blob_hash=digest
+    )
+    db.add(db_model)
+    db.commit()
+    db.refresh(db_model)
+    return db_model
+
+def _create_model_from_stored_blob(db: Session, model: schemas.ModelCreate, digest: str) -> Optional[models.Model]:
+    """
+    Create a model for content that is already stored; None if it is not
+    """
+    size = db.query(models.Blob.size).filter(models.Blob.hash == digest).scalar()
+    if size is None:
+        return None
+    return _create_model(db, model, digest, size)
+
+@router.post("/upload", response_model=schemas.Model, status_code=status.HTTP_201_CREATED)
+async def upload_model(
+    request: Request,
+    name: str,
+    file_type: str,
+    project_id: int,
+    content_sha256: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """
+    Upload a mesh as the raw request body
+
+    The body is hashed while it is streamed to disk. Clients that send the
+    SHA-256 of the file in a ``Content-SHA256`` header skip the transfer
+    entirely when that content is already stored.
+    """
+    model = schemas.ModelCreate(name=name, file_type=file_type, project_id=project_id)
+    digest = content_sha256.lower() if content_sha256 else None
+
+    # Database work runs in the threadpool like in the synchronous endpoints;
+    # this one is async only to stream the request body
+    if digest and blob_store.exists(digest):
+        db_model = await run_in_threadpool(_create_model_from_stored_blob, db, model, digest)
+        if db_model is not None:
+            return db_model
+
+    writer = blob_store.writer()
+    try:
+        async for chunk in request.stream():
+            await run_in_threadpool(writer.write, chunk)
+    except BaseException:
+        writer.abort()
+        raise
+    if digest and writer.hexdigest() != digest:
+        writer.abort()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Content does not match Content-SHA256")
+
+    try:
+        return await run_in_threadpool(_create_model, db, model, writer.hexdigest(), writer.size, writer)
+    except BaseException:
+        writer.abort()
+        raise
+
+@router.post("/from-blob", response_model=schemas.Model, status_code=status.HTTP_201_CREATED)
+def create_model_from_blob(model: schemas.ModelFromBlob, db: Session = Depends(get_db)):
+    """
+    Register a model for content that is already stored, without uploading it again
+    """
+    db_model = _create_model_from_stored_blob(db, model, model.blob_hash.lower())
+    if db_model is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Blob not found")
+    return db_model
+
+@router.delete("/{model_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_model(model_id: int, db: Session = Depends(get_db)):
+    db_model = db.query(models.Model).filter(models.Model.id == model_id).first()
+    if db_model is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Model not found")
+    if db_model.toolpaths:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Model still has toolpaths")
+
+    release_blob(db, db_model.blob_hash)
+    db.delete(db_model)
+    db.commit()
+    collect_garbage(db)
@@ -0,0 +1,38 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status as http_status
+from sqlalchemy.orm import Session
+
+from models import models, schemas
+from models.database import get_db
+from services.queries import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursor, list_simulations
+from services.storage import collect_garbage, release_blob
+
+router = APIRouter()
+
+@router.get("/", response_model=schemas.SimulationPage)
+def read_simulations(
+    project_id: Optional[int] = None,
+    status: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    try:
+        items, next_cursor = list_simulations(db, project_id, status, limit, cursor)
+    except InvalidCursor:
+        raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return {"items": items, "next_cursor": next_cursor}
+
+@router.delete("/{simulation_id}", status_code=http_status.HTTP_204_NO_CONTENT)
+def delete_simulation(simulation_id: int, db: Session = Depends(get_db)):
+    simulation = db.query(models.Simulation).filter(models.Simulation.id == simulation_id).first()
+    if simulation is None:
+        raise HTTPException(status_code=http_status.HTTP_404_NOT_FOUND, detail="Simulation not found")
+    if simulation.status in ("pending", "running"):
+        raise HTTPException(status_code=http_status.HTTP_409_CONFLICT, detail="Simulation is still running")
+
+    release_blob(db, simulation.blob_hash)
+    db.delete(simulation)
+    db.commit()
+    collect_garbage(db)
@@ -0,0 +1,37 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from models import models, schemas
+from models.database import get_db
+from services.queries import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursor, list_toolpaths
+from services.storage import collect_garbage, release_blob
+
+router = APIRouter()
+
+@router.get("/", response_model=schemas.ToolpathPage)
+def read_toolpaths(
+    project_id: int,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    try:
+        items, next_cursor = list_toolpaths(db, project_id, limit, cursor)
+    except InvalidCursor:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return {"items": items, "next_cursor": next_cursor}
+
+@router.delete("/{toolpath_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_toolpath(toolpath_id: int, db: Session = Depends(get_db)):
+    toolpath = db.query(models.Toolpath).filter(models.Toolpath.id == toolpath_id).first()
+    if toolpath is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Toolpath not found")
+    if toolpath.simulations:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Toolpath still has simulations")
+
+    release_blob(db, toolpath.blob_hash)
+    db.delete(toolpath)
+    db.commit()
+    collect_garbage(db)
@@ -3,8 +3,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
-from api import models, toolpaths, simulations, users
+from api import models, toolpaths, simulations, users, jobs, artifacts, metrics
 from models import database
+from services.log_format import configure_logging
+
+configure_logging()
 
 app = FastAPI(title="NexPath API", description="API for NexPath LFAM Platform")
 
@@ -18,26 +21,22 @@ app.add_middleware(
 )
 
 # Create database tables
-database.Base.metadata.create_all(bind=database.engine)
+database.create_schema()
 
 # Include routers
 app.include_router(models.router, prefix="/api/models", tags=["models"])
 app.include_router(toolpaths.router, prefix="/api/toolpaths", tags=["toolpaths"])
 app.include_router(simulations.router, prefix="/api/simulations", tags=["simulations"])
 app.include_router(users.router, prefix="/api/users", tags=["users"])
+app.include_router(jobs.router, prefix="/api/jobs", tags=["jobs"])
+app.include_router(jobs.ws_router, prefix="/ws/jobs", tags=["jobs"])
+app.include_router(artifacts.router, prefix="/api/artifacts", tags=["artifacts"])
+app.include_router(metrics.router, tags=["metrics"])
 
 @app.get("/")
 async def root():
     return {"message": "Welcome to NexPath API"}
 
-# Dependency to get the database session
-def get_db():
-    db = database.SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
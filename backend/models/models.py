@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Float, DateTime, Text
+from sqlalchemy import BigInteger, Boolean, Column, ForeignKey, Integer, String, Float, DateTime, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -24,7 +24,7 @@ class Project(Base):
     description = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    owner_id = Column(Integer, ForeignKey("users.id"))
+    owner_id = Column(Integer, ForeignKey("users.id"), index=True)
     
     owner = relationship("User", back_populates="projects")
     models = relationship("Model", back_populates="project")
@@ -38,25 +38,31 @@ class Model(Base):
     name = Column(String, index=True)
     file_path = Column(String)
     file_type = Column(String)  # STL, OBJ, etc.
+    blob_hash = Column(String(64), ForeignKey("blobs.hash"), nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    project_id = Column(Integer, ForeignKey("projects.id"))
+    project_id = Column(Integer, ForeignKey("projects.id"), index=True)
     
     project = relationship("Project", back_populates="models")
     toolpaths = relationship("Toolpath", back_populates="model")
 
 class Toolpath(Base):
     __tablename__ = "toolpaths"
+    __table_args__ = (
+        # A project's toolpaths, newest first (keyset pagination on created_at, id)
+        Index("ix_toolpaths_project_id_created_at_id", "project_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
     file_path = Column(String)
+    blob_hash = Column(String(64), ForeignKey("blobs.hash"), nullable=True, index=True)
     layer_height = Column(Float)
     infill_density = Column(Float)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     project_id = Column(Integer, ForeignKey("projects.id"))
-    model_id = Column(Integer, ForeignKey("models.id"))
+    model_id = Column(Integer, ForeignKey("models.id"), index=True)
     
     project = relationship("Project", back_populates="toolpaths")
     model = relationship("Model", back_populates="toolpaths")
@@ -64,15 +70,31 @@ class Toolpath(Base):
 
 class Simulation(Base):
     __tablename__ = "simulations"
+    __table_args__ = (
+        # A project's simulations, newest first (keyset pagination on created_at, id)
+        Index("ix_simulations_project_id_created_at_id", "project_id", "created_at", "id"),
+        # Simulations in a given status, newest first
+        Index("ix_simulations_status_created_at_id", "status", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
     result_path = Column(String)
-    status = Column(String)  # pending, running, completed, failed
+    blob_hash = Column(String(64), ForeignKey("blobs.hash"), nullable=True, index=True)
+    status = Column(String)  # pending, running, completed, failed, cancelled
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     project_id = Column(Integer, ForeignKey("projects.id"))
-    toolpath_id = Column(Integer, ForeignKey("toolpaths.id"))
+    toolpath_id = Column(Integer, ForeignKey("toolpaths.id"), index=True)
     
     project = relationship("Project", back_populates="simulations")
-    toolpath = relationship("Toolpath", back_populates="simulations")
\ No newline at end of file
+    toolpath = relationship("Toolpath", back_populates="simulations")
+
+class Blob(Base):
+    __tablename__ = "blobs"
+
+    # Content-addressed artifact; file_path columns point at the stored copy
+    hash = Column(String(64), primary_key=True)  # SHA-256 hex digest
+    size = Column(BigInteger)
+    ref_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
\ No newline at end of file
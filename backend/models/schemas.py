@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr
-from typing import List, Optional
+from pydantic import BaseModel, EmailStr, Field, PositiveFloat
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
 # User schemas
@@ -43,9 +43,13 @@ class ModelBase(BaseModel):
 class ModelCreate(ModelBase):
     project_id: int
 
+class ModelFromBlob(ModelCreate):
+    blob_hash: str
+
 class Model(ModelBase):
     id: int
     file_path: str
+    blob_hash: Optional[str] = None
     created_at: datetime
     updated_at: datetime
     project_id: int
@@ -66,6 +70,7 @@ class ToolpathCreate(ToolpathBase):
 class Toolpath(ToolpathBase):
     id: int
     file_path: str
+    blob_hash: Optional[str] = None
     created_at: datetime
     updated_at: datetime
     project_id: int
@@ -85,6 +90,7 @@ class SimulationCreate(SimulationBase):
 class Simulation(SimulationBase):
     id: int
     result_path: Optional[str] = None
+    blob_hash: Optional[str] = None
     status: str
     created_at: datetime
     updated_at: datetime
@@ -94,6 +100,54 @@ class Simulation(SimulationBase):
     class Config:
         orm_mode = True
 
+# Blob schemas
+class Blob(BaseModel):
+    hash: str
+    size: int
+    ref_count: int
+    created_at: datetime
+
+    class Config:
+        orm_mode = True
+
+# Paginated list schemas
+class ToolpathPage(BaseModel):
+    items: List[Toolpath]
+    next_cursor: Optional[str] = None
+
+class SimulationPage(BaseModel):
+    items: List[Simulation]
+    next_cursor: Optional[str] = None
+
+# Job schemas
+class SliceJobCreate(BaseModel):
+    model_id: int
+    name: str
+    layer_height: float = Field(0.2, gt=0)
+    infill_density: float = Field(0.2, gt=0, le=1)
+    profile: bool = False
+
+class ThermalJobCreate(BaseModel):
+    toolpath_id: int
+    name: str
+    dimensions: Tuple[PositiveFloat, PositiveFloat, PositiveFloat] = (100.0, 100.0, 100.0)
+    resolution: float = Field(5.0, gt=0)
+    steps_per_layer: int = Field(10, ge=1)
+    progress_interval: int = Field(10, ge=1)
+    profile: bool = False
+
+class Job(BaseModel):
+    id: str
+    kind: str
+    status: str
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    profile: bool = False
+    created_at: datetime
+
+    class Config:
+        orm_mode = True
+
 # Token schemas
 class Token(BaseModel):
     access_token: str
@@ -0,0 +1,11 @@
+import os
+import sys
+
+# The engine lives next to the backend in the repository and under /app/engine in the container
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from engine import instrumentation
+from engine.slicer.slicer import Slicer, layer_index_path, preview_path
+from engine.thermal_sim.thermal_simulator import ThermalSimulator, columnar_results_path
@@ -0,0 +1,119 @@
+import glob
+from typing import Any, Dict, Tuple
+
+from models import database, models
+from .engine import Slicer, ThermalSimulator, columnar_results_path
+from .jobs import Job, JobCancelled
+from .storage import blob_store, store_file
+
+def run_slice_job(job: Job, model_id: int, name: str, layer_height: float, infill_density: float) -> Dict[str, Any]:
+    """
+    Slice a stored model, write its G-code and register the resulting toolpath
+
+    Returns:
+        Dictionary with the created toolpath id and layer count
+    """
+    db = database.SessionLocal()
+    try:
+        model = db.query(models.Model).filter(models.Model.id == model_id).first()
+        if model is None:
+            raise ValueError(f"Model {model_id} not found")
+
+        slicer = Slicer(
+            {"layer_height": layer_height, "infill_density": infill_density},
+            progress_callback=job.report
+        )
+        if not slicer.load_model(model.file_path):
+            raise RuntimeError(f"Could not load model from {model.file_path}")
+        layers = slicer.slice()
+
+        job.report({"type": "progress", "stage": "gcode", "layer": len(layers), "total_layers": len(layers)})
+        output_path = blob_store.scratch_path(f"{job.id}.gcode")
+        if not slicer.generate_gcode(output_path):
+            raise RuntimeError("G-code generation failed")
+
+        # The layer index and previews are named by appending to the G-code path,
+        # so they keep the same suffix next to the blob
+        sidecars = glob.glob(glob.escape(output_path) + ".*")
+        digest, _ = store_file(db, output_path, {sidecar: sidecar[len(output_path):] for sidecar in sidecars})
+
+        toolpath = models.Toolpath(
+            name=name,
+            file_path=blob_store.path_for(digest),
+            blob_hash=digest,
+            layer_height=layer_height,
+            infill_density=infill_density,
+            project_id=model.project_id,
+            model_id=model.id
+        )
+        db.add(toolpath)
+        db.commit()
+        return {"toolpath_id": toolpath.id, "num_layers": len(layers)}
+    finally:
+        # Left behind only if the job failed before the files were stored
+        blob_store.clear_scratch(job.id)
+        db.close()
+
+def cancel_thermal_job(job: Job, simulation_id: int) -> None:
+    """
+    Mark the simulation of a thermal job cancelled before it started
+    """
+    db = database.SessionLocal()
+    try:
+        db.query(models.Simulation).filter(models.Simulation.id == simulation_id) \
+            .update({models.Simulation.status: "cancelled"}, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+def run_thermal_job(job: Job, simulation_id: int, dimensions: Tuple[float, float, float],
+                    resolution: float, steps_per_layer: int, progress_interval: int) -> Dict[str, Any]:
+    """
+    Deposit layers one by one, simulating heat diffusion after each, and store the results
+
+    Returns:
+        Dictionary with the simulation id and detected issues
+    """
+    db = database.SessionLocal()
+    try:
+        simulation = db.query(models.Simulation).filter(models.Simulation.id == simulation_id).first()
+        if simulation is None:
+            raise ValueError(f"Simulation {simulation_id} not found")
+        simulation.status = "running"
+        db.commit()
+
+        try:
+            simulator = ThermalSimulator(
+                {"resolution": resolution, "progress_interval": progress_interval},
+                progress_callback=job.report
+            )
+            simulator.initialize_grid(dimensions, resolution)
+            num_layers = simulator.grid.shape[2]
+            for z_level in range(num_layers):
+                simulator.add_layer({}, z_level)
+                job.report({"type": "progress", "stage": "deposit", "layer": z_level + 1, "total_layers": num_layers})
+                for _ in range(steps_per_layer):
+                    simulator.simulate_step()
+
+            results = simulator.analyze_results()
+            output_path = blob_store.scratch_path(f"{job.id}.json")
+            if not simulator.save_results(results, output_path):
+                raise RuntimeError("Could not save simulation results")
+            digest, _ = store_file(db, output_path, {columnar_results_path(output_path): ".npz"})
+        except JobCancelled:
+            simulation.status = "cancelled"
+            db.commit()
+            raise
+        except Exception:
+            simulation.status = "failed"
+            db.commit()
+            raise
+
+        simulation.status = "completed"
+        simulation.result_path = blob_store.path_for(digest)
+        simulation.blob_hash = digest
+        db.commit()
+        return {"simulation_id": simulation.id, "potential_issues": results["potential_issues"]}
+    finally:
+        blob_store.clear_scratch(job.id)
+        db.close()
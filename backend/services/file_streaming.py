@@ -0,0 +1,167 @@
+import os
+import zlib
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Iterable, Iterator, Optional, Tuple
+
+import zstandard
+
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+# Content codings we can produce on the fly, in order of preference
+SUPPORTED_ENCODINGS = ("zstd", "gzip")
+
+class RangeNotSatisfiable(ValueError):
+    """Raised when a Range header does not overlap the file"""
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range ``Range`` header
+
+    Args:
+        header: Value of the Range header, e.g. "bytes=0-1023"
+        size: Size of the file in bytes
+
+    Returns:
+        Inclusive (start, end) byte positions, or None to serve the whole file.
+        Multi-range and malformed headers are ignored, as RFC 9110 allows.
+    """
+    if not header or not header.startswith("bytes="):
+        return None
+    spec = header[len("bytes="):].strip()
+    if "," in spec or "-" not in spec:
+        return None
+
+    start_text, end_text = spec.split("-", 1)
+    try:
+        first = int(start_text) if start_text else None
+        last = int(end_text) if end_text else None
+    except ValueError:
+        return None
+
+    if first is None and last is None:
+        return None
+    if first is None:
+        # Suffix range: the last N bytes
+        if not last:
+            raise RangeNotSatisfiable(header)
+        start, end = max(0, size - last), size - 1
+    else:
+        start, end = first, size - 1 if last is None else last
+
+    if start >= size:
+        raise RangeNotSatisfiable(header)
+    if start > end:
+        return None
+    return start, min(end, size - 1)
+
+def select_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the preferred content coding the client accepts
+
+    Returns:
+        "zstd", "gzip" or None for identity
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for item in accept_encoding.split(","):
+        parts = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for param in parts[1:]:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        accepted[parts[0].lower()] = quality
+
+    for encoding in SUPPORTED_ENCODINGS:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+def iter_file(path: str, start: int = 0, end: Optional[int] = None, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Read a byte range of a file in chunks
+
+    Args:
+        path: File to read
+        start: First byte to read
+        end: Last byte to read (inclusive); None reads to the end of the file
+        chunk_size: Maximum size of each yielded chunk
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = None if end is None else end - start + 1
+        while remaining is None or remaining > 0:
+            chunk = f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+
+def iter_gzip(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """
+    Gzip-compress a stream of chunks without buffering it
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def iter_zstd(chunks: Iterable[bytes], level: int = 3) -> Iterator[bytes]:
+    """
+    Zstandard-compress a stream of chunks without buffering it
+    """
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def compress_stream(chunks: Iterable[bytes], encoding: Optional[str]) -> Iterable[bytes]:
+    if encoding == "zstd":
+        return iter_zstd(chunks)
+    if encoding == "gzip":
+        return iter_gzip(chunks)
+    return chunks
+
+def file_etag(path: str, encoding: Optional[str] = None) -> str:
+    """
+    Strong ETag of a file as served with the given content coding
+
+    Each coding gets its own tag, since a strong ETag identifies the exact
+    bytes sent and the compressed bodies differ from the file on disk.
+    """
+    stat = os.stat(path)
+    tag = f"{stat.st_size:x}-{stat.st_mtime_ns:x}"
+    return f'"{tag}-{encoding}"' if encoding else f'"{tag}"'
+
+def last_modified(path: str) -> str:
+    """
+    Modification time of a file as an HTTP-date
+    """
+    return formatdate(os.path.getmtime(path), usegmt=True)
+
+def if_range_matches(if_range: str, path: str) -> bool:
+    """
+    Whether an ``If-Range`` validator still matches the file on disk
+
+    Entity tags must equal the identity ETag, as ranges are never encoded;
+    weak tags never match. An HTTP-date matches if it equals the file's
+    modification time to the second. Unparseable values do not match, so the
+    full file is sent.
+    """
+    if_range = if_range.strip()
+    if if_range.startswith(("\"", "W/")):
+        return if_range == file_etag(path)
+    try:
+        date = parsedate_to_datetime(if_range)
+    except (TypeError, ValueError):
+        return False
+    return int(date.timestamp()) == int(os.path.getmtime(path))
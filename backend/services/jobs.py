@@ -0,0 +1,146 @@
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from .engine import instrumentation
+from .progress import ProgressChannel
+
+logger = logging.getLogger(__name__)
+
+class JobCancelled(Exception):
+    """Raised inside a running job once cancellation has been requested"""
+
+class Job:
+    def __init__(self, kind: str, profile: bool = False):
+        """
+        A long-running engine job whose events are streamed to clients
+
+        Args:
+            kind: Job type, e.g. "slice" or "thermal"
+            profile: Run the job under the sampling profiler
+        """
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = "pending"  # pending, running, completed, failed, cancelled
+        self.error: Optional[str] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.profile = profile
+        self.profile_stacks: Optional[str] = None
+        self.created_at = datetime.utcnow()
+        self.channel = ProgressChannel()
+        self._cancel_requested = threading.Event()
+
+    def report(self, event: Dict[str, Any]) -> None:
+        """
+        Progress callback handed to the engine; aborts the job if it was cancelled
+        """
+        if self._cancel_requested.is_set():
+            raise JobCancelled(self.id)
+        self.channel.publish(event)
+
+    def cancel(self) -> None:
+        self._cancel_requested.set()
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_requested.is_set()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "failed", "cancelled")
+
+    def _set_status(self, status: str, final: bool = False) -> None:
+        self.status = status
+        event = {"type": "status", "status": status, "error": self.error}
+        if final:
+            instrumentation.count("nexpath_jobs_total", kind=self.kind, status=status)
+            self.channel.close(event)
+        else:
+            self.channel.publish(event)
+
+class JobManager:
+    def __init__(self, max_workers: int = 2, max_finished_jobs: int = 256):
+        """
+        Run engine jobs on a bounded thread pool and keep track of them by id
+
+        Args:
+            max_workers: Number of jobs allowed to run concurrently
+            max_finished_jobs: Number of finished jobs kept for status queries
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="nexpath-job")
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_finished_jobs = max_finished_jobs
+
+    def submit(self, kind: str, fn: Callable[[Job], Optional[Dict[str, Any]]], profile: bool = False,
+               on_cancel: Optional[Callable[[Job], None]] = None) -> Job:
+        """
+        Queue a job for execution
+
+        Args:
+            kind: Job type
+            fn: Callable doing the work; receives the Job and returns its result
+            profile: Sample the job's stack while it runs; the collapsed
+                stacks are kept on ``Job.profile_stacks`` once it finishes
+            on_cancel: Called with the Job instead of ``fn`` if the job is
+                cancelled before it starts, to clean up state created for it
+
+        Returns:
+            The queued Job
+        """
+        job = Job(kind, profile)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        self._executor.submit(self._run, job, fn, on_cancel)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        job = self.get(job_id)
+        if job is not None and not job.finished:
+            job.cancel()
+        return job
+
+    def _run(self, job: Job, fn: Callable[[Job], Optional[Dict[str, Any]]],
+             on_cancel: Optional[Callable[[Job], None]]) -> None:
+        if job.cancel_requested:
+            if on_cancel is not None:
+                try:
+                    on_cancel(job)
+                except Exception:
+                    logger.exception("Job cancel hook failed", extra={"job_id": job.id, "kind": job.kind})
+            job._set_status("cancelled", final=True)
+            return
+        job._set_status("running")
+        profiler = instrumentation.SamplingProfiler().start() if job.profile else None
+        try:
+            job.result = fn(job)
+        except JobCancelled:
+            status = "cancelled"
+        except Exception as e:
+            logger.exception("Job failed", extra={"job_id": job.id, "kind": job.kind})
+            job.error = str(e)
+            status = "failed"
+        else:
+            status = "completed"
+
+        # Collect the profile before clients are told the job has finished
+        if profiler is not None:
+            profiler.stop()
+            job.profile_stacks = profiler.collapsed()
+        job._set_status(status, final=True)
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+job_manager = JobManager()
@@ -0,0 +1,63 @@
+import json
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from .engine import layer_index_path, preview_path
+
+@lru_cache(maxsize=64)
+def _read_index(path: str, mtime_ns: int) -> Dict[str, Any]:
+    # mtime_ns is part of the cache key so a regenerated toolpath is re-read
+    with open(path) as f:
+        return json.load(f)
+
+def load_layer_index(gcode_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the per-layer byte-offset index written next to a G-code file
+
+    Returns:
+        The parsed index, or None if the toolpath was generated without one
+    """
+    path = layer_index_path(gcode_path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _read_index(path, mtime_ns)
+
+def clamp_layer_range(index: Dict[str, Any], start: int, end: Optional[int]) -> Tuple[int, int]:
+    """
+    Clamp a requested inclusive layer range to the layers present in the index
+
+    Raises:
+        ValueError: If the range is empty
+    """
+    last_layer = len(index["layers"]) - 1
+    end = last_layer if end is None else min(end, last_layer)
+    if start < 0 or start > end:
+        raise ValueError(f"Invalid layer range {start}-{end} for {last_layer + 1} layers")
+    return start, end
+
+def gcode_byte_range(index: Dict[str, Any], start: int, end: int) -> Tuple[int, int]:
+    """
+    Inclusive byte range in the G-code file covering layers ``start`` to ``end``
+    """
+    first, last = index["layers"][start], index["layers"][end]
+    return first["offset"], last["offset"] + last["length"] - 1
+
+def read_previews(gcode_path: str, index: Dict[str, Any], start: int, end: int, lod: int) -> List[bytes]:
+    """
+    Read the preview records for a layer range at one level of detail
+
+    The records of consecutive layers are contiguous in the preview file, so
+    the whole range is fetched with a single seek and read.
+
+    Returns:
+        One JSON-encoded record per layer
+    """
+    first_offset, _ = index["layers"][start]["preview"][lod]
+    last_offset, last_length = index["layers"][end]["preview"][lod]
+    with open(preview_path(gcode_path, lod), "rb") as f:
+        f.seek(first_offset)
+        data = f.read(last_offset + last_length - first_offset)
+    return data.splitlines()
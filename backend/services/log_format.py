@@ -0,0 +1,56 @@
+import json
+import logging
+import os
+from datetime import datetime
+
+# Attributes every LogRecord has; anything else was passed through ``extra``.
+# uvicorn adds a colourised copy of its messages as ``color_message``.
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "color_message"}
+
+def _extra_fields(record: logging.LogRecord) -> dict:
+    return {
+        key: value for key, value in vars(record).items()
+        if key not in _RECORD_ATTRIBUTES and not key.startswith("_")
+    }
+
+class TextFormatter(logging.Formatter):
+    """
+    Format records as text, followed by their ``extra`` fields as key=value pairs
+    """
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        message = super().formatMessage(record)
+        fields = _extra_fields(record)
+        if not fields:
+            return message
+        return message + " " + " ".join(f"{key}={value!r}" for key, value in fields.items())
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line, including ``extra`` fields
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        entry.update(_extra_fields(record))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+def configure_logging() -> None:
+    """
+    Configure the root logger from ``LOG_LEVEL`` (default INFO) and
+    ``LOG_FORMAT`` ("json" or "text", default "text")
+    """
+    handler = logging.StreamHandler()
+    if os.getenv("LOG_FORMAT", "text").lower() == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(TextFormatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
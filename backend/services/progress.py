@@ -0,0 +1,72 @@
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+class ProgressChannel:
+    """
+    Fan-out of job events from a worker thread to any number of async subscribers.
+
+    Only the latest event of each ``type`` is kept, so a slow subscriber skips
+    straight to the newest state instead of working through a backlog, and a fast
+    producer never grows memory no matter how often it publishes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latest: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._seq = 0
+        self._closed = False
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        """
+        Record an event, replacing any pending event of the same type
+
+        Args:
+            event: Event payload; must contain a ``type`` key
+        """
+        with self._lock:
+            self._seq += 1
+            self._latest[event["type"]] = (self._seq, event)
+
+    def close(self, event: Dict[str, Any] = None) -> None:
+        """
+        Publish an optional final event and end all subscriptions
+        """
+        with self._lock:
+            if event is not None:
+                self._seq += 1
+                self._latest[event["type"]] = (self._seq, event)
+            self._closed = True
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def snapshot(self, since: int = 0) -> Tuple[int, List[Dict[str, Any]], bool]:
+        """
+        Collect events published after sequence number ``since``
+
+        Returns:
+            Tuple of (latest sequence number, new events in publish order, closed flag)
+        """
+        with self._lock:
+            pending = sorted(
+                (seq, event) for seq, event in self._latest.values() if seq > since
+            ) if self._seq > since else []
+            return self._seq, [event for _, event in pending], self._closed
+
+    async def subscribe(self, min_interval: float = 0.25) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield coalesced events until the channel is closed
+
+        Args:
+            min_interval: Minimum time in seconds between deliveries to this subscriber
+        """
+        last_seq = 0
+        while True:
+            last_seq, events, closed = self.snapshot(last_seq)
+            for event in events:
+                yield event
+            if closed:
+                return
+            await asyncio.sleep(min_interval)
@@ -0,0 +1,79 @@
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query, Session
+
+from models import models
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Opaque cursor pointing just past a row in (created_at DESC, id DESC) order
+    """
+    payload = json.dumps([created_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(payload)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(cursor) from e
+
+def paginate_newest_first(query: Query, model, limit: int, cursor: Optional[str] = None) -> Tuple[List, Optional[str]]:
+    """
+    Keyset-paginate a query in (created_at DESC, id DESC) order
+
+    Unlike OFFSET pagination, every page costs the same: the cursor is turned
+    into a range condition that the composite (..., created_at, id) indexes
+    can seek to directly.
+
+    Args:
+        query: Query already filtered to the rows of interest
+        model: Mapped class with ``created_at`` and ``id`` columns
+        limit: Maximum number of rows to return
+        cursor: Cursor returned with the previous page, or None for the first page
+
+    Returns:
+        Tuple of (rows, cursor for the next page or None if this is the last page)
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        # Row-value comparison so the database can seek the index instead of filtering
+        query = query.filter(tuple_(model.created_at, model.id) < tuple_(created_at, row_id))
+
+    rows = query.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
+
+def list_toolpaths(db: Session, project_id: int, limit: int = DEFAULT_PAGE_SIZE,
+                   cursor: Optional[str] = None) -> Tuple[List[models.Toolpath], Optional[str]]:
+    """
+    A project's toolpaths, newest first
+    """
+    query = db.query(models.Toolpath).filter(models.Toolpath.project_id == project_id)
+    return paginate_newest_first(query, models.Toolpath, limit, cursor)
+
+def list_simulations(db: Session, project_id: Optional[int] = None, status: Optional[str] = None,
+                     limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Tuple[List[models.Simulation], Optional[str]]:
+    """
+    Simulations newest first, optionally restricted to a project and/or a status
+    """
+    query = db.query(models.Simulation)
+    if project_id is not None:
+        query = query.filter(models.Simulation.project_id == project_id)
+    if status is not None:
+        query = query.filter(models.Simulation.status == status)
+    return paginate_newest_first(query, models.Simulation, limit, cursor)
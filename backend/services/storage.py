@@ -0,0 +1,229 @@
+import glob
+import hashlib
+import os
+import shutil
+import uuid
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models import models
+
+DATA_DIR = os.getenv("NEXPATH_DATA_DIR", "./data")
+BLOB_DIR = os.getenv("NEXPATH_BLOB_DIR", os.path.join(DATA_DIR, "blobs"))
+
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+def _is_sha256(digest: str) -> bool:
+    return len(digest) == 64 and all(c in "0123456789abcdef" for c in digest)
+
+def file_digest(path: str) -> Tuple[str, int]:
+    """
+    SHA-256 hex digest and size of a file, read in chunks
+    """
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest(), os.path.getsize(path)
+
+class BlobWriter:
+    def __init__(self, store: "BlobStore"):
+        """
+        Incrementally write and hash a new blob
+
+        Data goes to a scratch file inside the store, so committing is a rename
+        on the same filesystem and nothing is ever held fully in memory.
+        """
+        self.store = store
+        self.size = 0
+        self._hash = hashlib.sha256()
+        self._path = store.scratch_path(uuid.uuid4().hex)
+        self._file = open(self._path, "wb")
+
+    def write(self, chunk: bytes) -> None:
+        self._hash.update(chunk)
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def hexdigest(self) -> str:
+        """
+        SHA-256 of the data written so far
+        """
+        return self._hash.hexdigest()
+
+    def commit(self) -> Tuple[str, int, bool]:
+        """
+        Move the data into place under its hash
+
+        Call this only while holding a reference taken with ``acquire_blob``
+        in the open transaction, so ``collect_garbage`` cannot remove the
+        blob between this check and the commit.
+
+        Returns:
+            Tuple of (sha256 hex digest, size in bytes, whether the blob was new)
+        """
+        self._file.close()
+        digest = self._hash.hexdigest()
+        return digest, self.size, self.store._adopt(self._path, digest)
+
+    def abort(self) -> None:
+        self._file.close()
+        if os.path.exists(self._path):
+            os.remove(self._path)
+
+class BlobStore:
+    def __init__(self, root: str):
+        """
+        Content-addressed file storage
+
+        Blobs are stored once under ``<root>/<first two hex digits>/<sha256>``.
+        Derived files (G-code layer index, LOD previews, columnar results) are
+        stored next to their blob as ``<blob path><suffix>``, so the engine's
+        sidecar path helpers work unchanged on blob paths.
+
+        Args:
+            root: Directory holding the blobs
+        """
+        self.root = root
+        os.makedirs(os.path.join(self.root, "tmp"), exist_ok=True)
+
+    def path_for(self, digest: str) -> str:
+        if not _is_sha256(digest):
+            raise ValueError(f"Not a SHA-256 digest: {digest!r}")
+        return os.path.join(self.root, digest[:2], digest)
+
+    def scratch_path(self, name: str) -> str:
+        """
+        Path on the store's filesystem for files that will be added with ``put_file``
+        """
+        return os.path.join(self.root, "tmp", name)
+
+    def clear_scratch(self, name: str) -> None:
+        """
+        Remove the scratch file ``name`` and any ``name.<suffix>`` files next to it
+        """
+        pattern = glob.escape(self.scratch_path(name))
+        for path in glob.glob(pattern) + glob.glob(pattern + ".*"):
+            os.remove(path)
+
+    def exists(self, digest: str) -> bool:
+        return _is_sha256(digest) and os.path.exists(self.path_for(digest))
+
+    def writer(self) -> BlobWriter:
+        return BlobWriter(self)
+
+    def put_file(self, path: str, digest: str, companions: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Move an existing file into the store; see ``store_file``
+
+        Args:
+            path: File to add; it is moved, or deleted if the blob already exists
+            digest: SHA-256 of the file, from ``file_digest``
+            companions: Derived files to keep next to the blob, as
+                {source path: suffix appended to the blob path}
+
+        Returns:
+            Whether the blob was new
+        """
+        created = self._adopt(path, digest)
+        target = self.path_for(digest)
+        for source, suffix in (companions or {}).items():
+            if not os.path.exists(source):
+                continue
+            if created or not os.path.exists(target + suffix):
+                shutil.move(source, target + suffix)
+            else:
+                os.remove(source)
+        return created
+
+    def delete(self, digest: str) -> None:
+        """
+        Remove a blob and its derived files
+        """
+        target = self.path_for(digest)
+        for path in [target] + glob.glob(glob.escape(target) + ".*"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _adopt(self, path: str, digest: str) -> bool:
+        target = self.path_for(digest)
+        if os.path.exists(target):
+            os.remove(path)
+            return False
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.move(path, target)
+        return True
+
+blob_store = BlobStore(BLOB_DIR)
+
+def acquire_blob(db: Session, digest: str, size: int) -> None:
+    """
+    Record one more reference to a blob, creating its row on first use
+
+    The caller commits together with the row that holds the reference. Until
+    then the blob row is write-locked, which blocks ``collect_garbage`` from
+    deleting it; a row that was collected just before is recreated, and its
+    file is already gone. Only trust or move the blob's file on disk after
+    calling this.
+    """
+    updated = db.query(models.Blob).filter(models.Blob.hash == digest) \
+        .update({models.Blob.ref_count: models.Blob.ref_count + 1}, synchronize_session=False)
+    if updated:
+        return
+    try:
+        with db.begin_nested():
+            db.add(models.Blob(hash=digest, size=size, ref_count=1))
+    except IntegrityError:
+        # Another request registered the same content concurrently
+        db.query(models.Blob).filter(models.Blob.hash == digest) \
+            .update({models.Blob.ref_count: models.Blob.ref_count + 1}, synchronize_session=False)
+
+def store_file(db: Session, path: str, companions: Optional[Dict[str, str]] = None,
+               store: BlobStore = blob_store) -> Tuple[str, int]:
+    """
+    Move a file into the store and take a reference to it; the caller commits
+
+    Args:
+        db: Session whose transaction holds the reference
+        path: File to add
+        companions: Derived files, as for ``BlobStore.put_file``
+        store: Blob store to add the file to
+
+    Returns:
+        Tuple of (sha256 hex digest, size in bytes)
+    """
+    digest, size = file_digest(path)
+    acquire_blob(db, digest, size)
+    store.put_file(path, digest, companions)
+    return digest, size
+
+def release_blob(db: Session, digest: Optional[str]) -> None:
+    """
+    Drop one reference to a blob; the caller commits and then runs ``collect_garbage``
+    """
+    if digest:
+        db.query(models.Blob).filter(models.Blob.hash == digest) \
+            .update({models.Blob.ref_count: models.Blob.ref_count - 1}, synchronize_session=False)
+
+def collect_garbage(db: Session, store: BlobStore = blob_store) -> int:
+    """
+    Delete blobs that are no longer referenced
+
+    Returns:
+        Number of blobs removed
+    """
+    removed = 0
+    for (digest,) in db.query(models.Blob.hash).filter(models.Blob.ref_count <= 0).all():
+        # Conditional delete so a blob re-acquired in the meantime survives. The
+        # row stays locked until the commit, so the file is removed before any
+        # concurrent acquire_blob for the same content can go on to use it.
+        deleted = db.query(models.Blob) \
+            .filter(models.Blob.hash == digest, models.Blob.ref_count <= 0) \
+            .delete(synchronize_session=False)
+        if deleted:
+            store.delete(digest)
+            removed += 1
+        db.commit()
+    return removed
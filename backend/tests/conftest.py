@@ -0,0 +1,40 @@
+import os
+import sys
+import tempfile
+
+# Point the database and blob store at a scratch directory before any backend
+# module reads its configuration from the environment
+_DATA_DIR = tempfile.mkdtemp(prefix="nexpath-tests-")
+os.environ["NEXPATH_DATA_DIR"] = _DATA_DIR
+os.environ["NEXPATH_BLOB_DIR"] = os.path.join(_DATA_DIR, "blobs")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DATA_DIR, 'nexpath.db')}"
+
+# The backend imports its packages from its own directory, the engine from the repository root
+_BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_REPO_ROOT = os.path.dirname(_BACKEND_DIR)
+for _path in (_REPO_ROOT, _BACKEND_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import pytest
+
+from models import database
+
+@pytest.fixture
+def db():
+    database.Base.metadata.drop_all(bind=database.engine)
+    database.create_schema()
+    session = database.SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+@pytest.fixture
+def client(db):
+    from fastapi.testclient import TestClient
+
+    import main
+
+    with TestClient(main.app) as test_client:
+        yield test_client
@@ -0,0 +1,56 @@
+import pytest
+
+from models import models
+from services.storage import blob_store, store_file
+
+GCODE = b"; NexPath LFAM G-code\n" + b"G1 X0 Y0 E1 F1500 ; Contour\n" * 100
+
+@pytest.fixture
+def toolpath(db):
+    path = blob_store.scratch_path("artifact.gcode")
+    with open(path, "wb") as f:
+        f.write(GCODE)
+    digest, _ = store_file(db, path)
+    toolpath = models.Toolpath(name="part", file_path=blob_store.path_for(digest), blob_hash=digest)
+    db.add(toolpath)
+    db.commit()
+    return toolpath
+
+def test_head_matches_get_without_body(client, toolpath):
+    url = f"/api/artifacts/toolpaths/{toolpath.id}/gcode"
+    get = client.get(url, headers={"Accept-Encoding": "identity"})
+    head = client.head(url, headers={"Accept-Encoding": "identity"})
+
+    assert head.status_code == 200
+    assert head.content == b""
+    for name in ("Content-Length", "Accept-Ranges", "ETag", "Last-Modified"):
+        assert head.headers[name] == get.headers[name]
+    assert head.headers["Content-Length"] == str(len(GCODE))
+
+def test_head_with_range(client, toolpath):
+    head = client.head(f"/api/artifacts/toolpaths/{toolpath.id}/gcode", headers={"Range": "bytes=0-9"})
+
+    assert head.status_code == 206
+    assert head.content == b""
+    assert head.headers["Content-Range"] == f"bytes 0-9/{len(GCODE)}"
+
+def test_range_and_if_range(client, toolpath):
+    url = f"/api/artifacts/toolpaths/{toolpath.id}/gcode"
+    etag = client.head(url, headers={"Accept-Encoding": "identity"}).headers["ETag"]
+
+    partial = client.get(url, headers={"Range": "bytes=-10", "If-Range": etag})
+    assert partial.status_code == 206
+    assert partial.content == GCODE[-10:]
+
+    stale = client.get(url, headers={"Range": "bytes=-10", "If-Range": '"stale"', "Accept-Encoding": "identity"})
+    assert stale.status_code == 200
+    assert stale.content == GCODE
+
+def test_compressed_download_has_its_own_etag(client, toolpath):
+    url = f"/api/artifacts/toolpaths/{toolpath.id}/gcode"
+    plain = client.get(url, headers={"Accept-Encoding": "identity"})
+    gzipped = client.get(url, headers={"Accept-Encoding": "gzip"})
+
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert gzipped.content == GCODE
+    assert gzipped.headers["ETag"] != plain.headers["ETag"]
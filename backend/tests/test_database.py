@@ -0,0 +1,19 @@
+from sqlalchemy import inspect, text
+
+from models import database
+
+def test_create_schema_adds_missing_columns(db):
+    # A database created before models gained blob_hash
+    database.Base.metadata.drop_all(bind=database.engine)
+    with database.engine.begin() as connection:
+        connection.execute(text("CREATE TABLE models (id INTEGER PRIMARY KEY, name VARCHAR, file_path VARCHAR)"))
+        connection.execute(text("INSERT INTO models (id, name, file_path) VALUES (1, 'part', 'part.stl')"))
+
+    database.create_schema()
+
+    inspector = inspect(database.engine)
+    columns = {column["name"] for column in inspector.get_columns("models")}
+    assert {"blob_hash", "project_id", "created_at"} <= columns
+    assert "ix_models_blob_hash" in {index["name"] for index in inspector.get_indexes("models")}
+    with database.engine.connect() as connection:
+        assert connection.execute(text("SELECT name, blob_hash FROM models")).all() == [("part", None)]
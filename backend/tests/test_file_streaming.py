@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from services.file_streaming import (
+    RangeNotSatisfiable, file_etag, if_range_matches, last_modified, parse_range, select_encoding
+)
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-99", (0, 99)),
+    ("bytes=10-", (10, 999)),
+    ("bytes=-100", (900, 999)),
+    ("bytes=-5000", (0, 999)),
+    ("bytes=900-5000", (900, 999)),
+    ("bytes=999-999", (999, 999)),
+])
+def test_parse_range(header, expected):
+    assert parse_range(header, 1000) == expected
+
+@pytest.mark.parametrize("header", [
+    None,
+    "",
+    "items=0-10",
+    "bytes=0-10,20-30",
+    "bytes=abc-10",
+    "bytes=-",
+    "bytes=10",
+    "bytes=50-10",
+])
+def test_parse_range_ignores_unsupported_and_malformed(header):
+    assert parse_range(header, 1000) is None
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=5000-6000", "bytes=-0"])
+def test_parse_range_past_end_is_not_satisfiable(header):
+    with pytest.raises(RangeNotSatisfiable):
+        parse_range(header, 1000)
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    (None, None),
+    ("", None),
+    ("identity", None),
+    ("gzip", "gzip"),
+    ("gzip, zstd", "zstd"),
+    ("ZSTD", "zstd"),
+    ("zstd;q=0, gzip;q=0.5", "gzip"),
+    ("gzip;q=0", None),
+    ("*", "zstd"),
+    ("*;q=0", None),
+    ("zstd;q=0, *", "gzip"),
+    ("gzip;q=abc", None),
+])
+def test_select_encoding(accept_encoding, expected):
+    assert select_encoding(accept_encoding) == expected
+
+def test_file_etag_differs_per_encoding(tmp_path):
+    path = tmp_path / "part.gcode"
+    path.write_bytes(b"G28\n")
+
+    tags = {file_etag(str(path), encoding) for encoding in (None, "gzip", "zstd")}
+    assert len(tags) == 3
+    assert all(tag.startswith('"') and tag.endswith('"') for tag in tags)
+
+def test_if_range_matches(tmp_path):
+    path = tmp_path / "part.gcode"
+    path.write_bytes(b"G28\n")
+    path = str(path)
+
+    assert if_range_matches(file_etag(path), path)
+    assert if_range_matches(last_modified(path), path)
+    assert not if_range_matches(file_etag(path, "gzip"), path)
+    assert not if_range_matches("W/" + file_etag(path), path)
+    assert not if_range_matches("not a date", path)
+
+def test_if_range_does_not_match_after_modification(tmp_path):
+    path = tmp_path / "part.gcode"
+    path.write_bytes(b"G28\n")
+    path = str(path)
+    etag, date = file_etag(path), last_modified(path)
+
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    assert not if_range_matches(etag, path)
+    assert not if_range_matches(date, path)
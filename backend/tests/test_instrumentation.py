@@ -0,0 +1,113 @@
+import threading
+import time
+
+import pytest
+
+from engine import instrumentation
+from engine.instrumentation import DURATION_BUCKETS, PHASE_METRIC, Registry, SamplingProfiler
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = Registry()
+    monkeypatch.setattr(instrumentation, "registry", registry)
+    return registry
+
+def _lines(text, prefix):
+    return [line for line in text.splitlines() if line.startswith(prefix)]
+
+def test_histogram_buckets_are_cumulative():
+    registry = Registry()
+    for seconds in (0.0001, 0.003, 0.003, 0.2, 1000.0):
+        registry.observe("slicer", "load", seconds)
+
+    text = registry.render_prometheus()
+    buckets = _lines(text, f"{PHASE_METRIC}_bucket")
+    counts = [int(line.rsplit(" ", 1)[1]) for line in buckets]
+
+    assert len(buckets) == len(DURATION_BUCKETS) + 1
+    assert counts == sorted(counts)
+    assert buckets[0] == f'{PHASE_METRIC}_bucket{{component="slicer",phase="load",le="0.0005"}} 1'
+    assert f'{PHASE_METRIC}_bucket{{component="slicer",phase="load",le="0.005"}} 3' in buckets
+    # 1000 s is above every bound, so it only shows up in +Inf
+    assert counts[-2] == 4
+    assert buckets[-1] == f'{PHASE_METRIC}_bucket{{component="slicer",phase="load",le="+Inf"}} 5'
+    assert _lines(text, f"{PHASE_METRIC}_count") == [f'{PHASE_METRIC}_count{{component="slicer",phase="load"}} 5']
+    assert _lines(text, f"# TYPE {PHASE_METRIC}") == [f"# TYPE {PHASE_METRIC} histogram"]
+
+def test_counters_and_label_escaping():
+    registry = Registry()
+    registry.increment("nexpath_jobs_total", kind="slice", status="completed")
+    registry.increment("nexpath_jobs_total", kind="slice", status="completed")
+    registry.increment("nexpath_test_total", 2.5, path='C:\\parts\n"a"')
+
+    assert registry.render_prometheus().splitlines() == [
+        "# TYPE nexpath_jobs_total counter",
+        'nexpath_jobs_total{kind="slice",status="completed"} 2',
+        "# TYPE nexpath_test_total counter",
+        'nexpath_test_total{path="C:\\\\parts\\n\\"a\\""} 2.5',
+    ]
+
+def test_disabled_instrumentation_records_nothing(registry, monkeypatch):
+    monkeypatch.setattr(instrumentation, "_enabled", False)
+
+    @instrumentation.instrumented("slicer", "slice")
+    def work():
+        return 42
+
+    assert instrumentation.timed("slicer", "load") is instrumentation._NOOP_TIMER
+    with instrumentation.timed("slicer", "load"):
+        pass
+    instrumentation.count("nexpath_slicer_layers_total", 10)
+    assert work() == 42
+
+    assert registry.render_prometheus() == "\n"
+
+def test_enabled_instrumentation_records(registry, monkeypatch):
+    monkeypatch.setattr(instrumentation, "_enabled", True)
+
+    @instrumentation.instrumented("slicer", "slice")
+    def work():
+        return 42
+
+    with instrumentation.timed("slicer", "load"):
+        pass
+    instrumentation.count("nexpath_slicer_layers_total", 10)
+    assert work() == 42
+
+    text = registry.render_prometheus()
+    assert f'{PHASE_METRIC}_count{{component="slicer",phase="load"}} 1' in text
+    assert f'{PHASE_METRIC}_count{{component="slicer",phase="slice"}} 1' in text
+    assert "nexpath_slicer_layers_total 10" in text
+
+def test_sampling_profiler_collapsed_stacks():
+    stop = threading.Event()
+
+    def busy_worker():
+        while not stop.is_set():
+            sum(range(1000))
+
+    thread = threading.Thread(target=busy_worker)
+    thread.start()
+    try:
+        with SamplingProfiler(thread.ident, interval=0.001) as profiler:
+            time.sleep(0.1)
+    finally:
+        stop.set()
+        thread.join()
+
+    lines = profiler.collapsed().splitlines()
+    assert lines
+    counts = []
+    for line in lines:
+        stack, samples = line.rsplit(" ", 1)
+        frames = stack.split(";")
+        assert frames[0].startswith("_bootstrap (threading.py:")
+        counts.append(int(samples))
+    assert any("busy_worker (test_instrumentation.py:" in line for line in lines)
+    assert counts == sorted(counts, reverse=True)
+
+def test_metrics_content_type(client):
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
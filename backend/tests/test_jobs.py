@@ -0,0 +1,128 @@
+import asyncio
+import threading
+import time
+from functools import partial
+
+import pytest
+
+from api.jobs import MAX_EVENT_INTERVAL, MIN_EVENT_INTERVAL
+from models import models
+from services.engine_jobs import cancel_thermal_job
+from services.jobs import JobManager, job_manager
+from services.progress import ProgressChannel
+
+def _collect(channel, min_interval=0.01):
+    async def collect():
+        return [event async for event in channel.subscribe(min_interval)]
+    return asyncio.run(collect())
+
+def test_channel_keeps_latest_event_of_each_type_in_publish_order():
+    channel = ProgressChannel()
+    channel.publish({"type": "progress", "layer": 1})
+    channel.publish({"type": "temperature", "max": 200})
+    channel.publish({"type": "progress", "layer": 2})
+
+    seq, events, closed = channel.snapshot()
+
+    assert seq == 3
+    assert events == [{"type": "temperature", "max": 200}, {"type": "progress", "layer": 2}]
+    assert not closed
+    assert channel.snapshot(seq) == (3, [], False)
+
+def test_late_subscriber_gets_final_status():
+    channel = ProgressChannel()
+    channel.publish({"type": "progress", "layer": 1})
+    channel.close({"type": "status", "status": "completed"})
+
+    assert _collect(channel) == [
+        {"type": "progress", "layer": 1},
+        {"type": "status", "status": "completed"},
+    ]
+
+@pytest.fixture
+def manager():
+    manager = JobManager(max_workers=1)
+    yield manager
+    manager._executor.shutdown(wait=True)
+
+def test_job_completes(manager):
+    job = manager.submit("slice", lambda job: {"layers": 3})
+    manager._executor.shutdown(wait=True)
+
+    assert job.status == "completed"
+    assert job.result == {"layers": 3}
+    assert _collect(job.channel)[-1] == {"type": "status", "status": "completed", "error": None}
+
+def test_failed_job_records_error(manager):
+    def fail(job):
+        raise RuntimeError("no model")
+
+    job = manager.submit("slice", fail)
+    manager._executor.shutdown(wait=True)
+
+    assert job.status == "failed"
+    assert job.error == "no model"
+
+def test_cancel_before_start_runs_cancel_hook(db, manager):
+    simulation = models.Simulation(name="sim", status="pending")
+    db.add(simulation)
+    db.commit()
+
+    # Occupy the only worker so the thermal job stays queued
+    release = threading.Event()
+    blocker = manager.submit("slice", lambda job: release.wait(5) and None)
+    ran = []
+    job = manager.submit("thermal", lambda job: ran.append(job),
+                         on_cancel=partial(cancel_thermal_job, simulation_id=simulation.id))
+    manager.cancel(job.id)
+    release.set()
+    manager._executor.shutdown(wait=True)
+
+    assert blocker.status == "completed"
+    assert job.status == "cancelled"
+    assert ran == []
+    db.refresh(simulation)
+    assert simulation.status == "cancelled"
+
+def test_cancel_while_running(manager):
+    started, resume = threading.Event(), threading.Event()
+
+    def work(job):
+        started.set()
+        resume.wait(5)
+        job.report({"type": "progress", "layer": 1})
+        return {"unreachable": True}
+
+    job = manager.submit("slice", work)
+    started.wait(5)
+    assert job.status == "running"
+    manager.cancel(job.id)
+    resume.set()
+    manager._executor.shutdown(wait=True)
+
+    assert job.status == "cancelled"
+    assert job.result is None
+    assert manager.cancel(job.id) is job
+    assert job.status == "cancelled"
+
+@pytest.mark.parametrize("interval", [MIN_EVENT_INTERVAL / 2, MAX_EVENT_INTERVAL * 2])
+def test_event_interval_out_of_bounds(client, interval):
+    job = job_manager.submit("slice", lambda job: None)
+
+    response = client.get(f"/api/jobs/{job.id}/events", params={"interval": interval})
+
+    assert response.status_code == 422
+
+def test_event_stream_of_finished_job(client):
+    job = job_manager.submit("slice", lambda job: {"layers": 1})
+    while not job.finished:
+        time.sleep(0.01)
+
+    response = client.get(f"/api/jobs/{job.id}/events", params={"interval": MIN_EVENT_INTERVAL})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text.endswith('event: status\ndata: {"type": "status", "status": "completed", "error": null}\n\n')
+
+def test_events_of_unknown_job(client):
+    assert client.get("/api/jobs/unknown/events").status_code == 404
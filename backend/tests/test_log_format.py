@@ -0,0 +1,24 @@
+import json
+import logging
+
+from services.log_format import JsonFormatter, TextFormatter
+
+def _record(**extra):
+    record = logging.LogRecord("engine.slicer.slicer", logging.INFO, __file__, 1, "Loading %s", ("model",), None)
+    record.__dict__.update(extra)
+    return record
+
+def test_text_formatter_appends_extra_fields():
+    formatter = TextFormatter("%(levelname)s %(name)s: %(message)s")
+
+    assert formatter.format(_record(file_path="/data/part.stl", layers=3)) == \
+        "INFO engine.slicer.slicer: Loading model file_path='/data/part.stl' layers=3"
+    assert formatter.format(_record()) == "INFO engine.slicer.slicer: Loading model"
+    assert formatter.format(_record(color_message="\x1b[1mLoading model\x1b[0m")) == \
+        "INFO engine.slicer.slicer: Loading model"
+
+def test_json_formatter_includes_extra_fields():
+    entry = json.loads(JsonFormatter().format(_record(file_path="/data/part.stl")))
+
+    assert entry["message"] == "Loading model"
+    assert entry["file_path"] == "/data/part.stl"
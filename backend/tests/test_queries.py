@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from models import models
+from services.queries import InvalidCursor, decode_cursor, encode_cursor, list_simulations, list_toolpaths
+
+def _add_toolpaths(db, project, timestamps):
+    for i, created_at in enumerate(timestamps):
+        db.add(models.Toolpath(name=f"toolpath-{i}", project_id=project.id, created_at=created_at))
+    db.commit()
+
+def _all_pages(fetch, limit):
+    rows, cursor, pages = [], None, 0
+    while True:
+        page, cursor = fetch(limit=limit, cursor=cursor)
+        rows.extend(page)
+        pages += 1
+        if cursor is None:
+            return rows, pages
+
+@pytest.fixture
+def project(db):
+    project = models.Project(name="part")
+    db.add(project)
+    db.commit()
+    return project
+
+def test_cursor_round_trip():
+    created_at = datetime(2025, 3, 1, 12, 30, 15, 123456)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", "!!!", encode_cursor(datetime(2025, 1, 1), 1)[:-4]])
+def test_decode_cursor_rejects_garbage(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor)
+
+def test_pages_cover_every_row_once_with_created_at_ties(db, project):
+    # Groups of rows share a timestamp, so only the id keeps the order total
+    base = datetime(2025, 1, 1)
+    _add_toolpaths(db, project, [base + timedelta(seconds=i // 4) for i in range(23)])
+
+    rows, pages = _all_pages(lambda **page: list_toolpaths(db, project.id, **page), limit=5)
+
+    assert pages == 5
+    assert len({row.id for row in rows}) == 23
+    assert [(row.created_at, row.id) for row in rows] == \
+        sorted(((row.created_at, row.id) for row in rows), reverse=True)
+
+def test_last_full_page_has_no_cursor(db, project):
+    _add_toolpaths(db, project, [datetime(2025, 1, 1)] * 10)
+
+    page, cursor = list_toolpaths(db, project.id, limit=10)
+    assert len(page) == 10
+    assert cursor is None
+
+def test_pagination_respects_filters(db, project):
+    other = models.Project(name="other")
+    db.add(other)
+    db.commit()
+    base = datetime(2025, 1, 1)
+    for i in range(12):
+        db.add(models.Simulation(name=f"sim-{i}", status="completed" if i % 3 else "failed",
+                                 project_id=project.id if i % 2 else other.id,
+                                 created_at=base + timedelta(minutes=i)))
+    db.commit()
+
+    rows, _ = _all_pages(lambda **page: list_simulations(db, project.id, "completed", **page), limit=2)
+
+    assert [row.name for row in rows] == ["sim-11", "sim-7", "sim-5", "sim-1"]
@@ -0,0 +1,76 @@
+import json
+import math
+import os
+
+import pytest
+
+from engine.slicer.simplify import douglas_peucker, simplify_layer
+from engine.slicer.slicer import Slicer, layer_index_path, preview_path
+
+def test_douglas_peucker_keeps_short_polylines():
+    assert douglas_peucker([], 1.0) == []
+    assert douglas_peucker([(0, 0), (1, 1)], 1.0) == [(0, 0), (1, 1)]
+
+def test_douglas_peucker_drops_collinear_vertices_at_zero_tolerance():
+    points = [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2)]
+    assert douglas_peucker(points, 0.0) == [(0, 0), (2, 0), (2, 2)]
+
+def test_douglas_peucker_respects_tolerance():
+    points = [(0, 0), (1, 0.4), (2, 0), (3, 1.5), (4, 0)]
+    assert douglas_peucker(points, 0.0) == points
+    assert douglas_peucker(points, 0.5) == [(0, 0), (2, 0), (3, 1.5), (4, 0)]
+    assert douglas_peucker(points, 2.0) == [(0, 0), (4, 0)]
+
+def test_douglas_peucker_simplifies_closed_loops():
+    circle = [(10 * math.cos(math.radians(a)), 10 * math.sin(math.radians(a))) for a in range(0, 360, 10)]
+    loop = circle + [circle[0]]
+
+    simplified = douglas_peucker(loop, 1.0)
+
+    assert simplified[0] == simplified[-1] == loop[0]
+    assert 4 < len(simplified) < len(loop)
+
+def test_simplify_layer_closes_contours_and_rounds():
+    layer = {"contours": [[(0.0, 0.0), (10.0, 0.0), (10.0, 10.0)]], "infill": [[(1.23456, 2.0), (3.0, 4.0)]]}
+
+    assert simplify_layer(layer, 0.0) == [
+        [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 0.0)],
+        [(1.235, 2.0), (3.0, 4.0)],
+    ]
+
+@pytest.fixture(scope="module")
+def gcode(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("slicer") / "part.gcode")
+    slicer = Slicer({"layer_height": 2.0})
+    assert slicer.load_model("part.stl")
+    slicer.slice()
+    assert slicer.generate_gcode(path)
+    with open(layer_index_path(path)) as f:
+        return path, json.load(f)
+
+def test_layer_index_offsets_point_at_layers(gcode):
+    path, index = gcode
+    with open(path, "rb") as f:
+        data = f.read()
+
+    assert index["gcode_size"] == len(data) == os.path.getsize(path)
+    for entry in index["layers"]:
+        chunk = data[entry["offset"]:entry["offset"] + entry["length"]].decode()
+        assert chunk.startswith(f"; Layer {entry['layer']}, ")
+        assert chunk.count("; Layer ") == 1
+
+def test_preview_offsets_point_at_layers(gcode):
+    path, index = gcode
+    sizes = []
+    for lod in range(len(index["preview_tolerances"])):
+        with open(preview_path(path, lod), "rb") as f:
+            data = f.read()
+        sizes.append(len(data))
+        for entry in index["layers"]:
+            offset, length = entry["preview"][lod]
+            preview = json.loads(data[offset:offset + length])
+            assert preview["layer"] == entry["layer"]
+
+    # Coarser levels of detail are strictly smaller
+    assert sizes == sorted(sizes, reverse=True)
+    assert len(set(sizes)) == len(sizes)
@@ -0,0 +1,135 @@
+import hashlib
+import os
+
+import pytest
+
+from models import models
+from services.engine_jobs import run_slice_job
+from services.jobs import Job
+from services.storage import (
+    BlobStore, acquire_blob, collect_garbage, file_digest, release_blob, store_file
+)
+
+@pytest.fixture
+def store(tmp_path):
+    return BlobStore(str(tmp_path / "blobs"))
+
+def _scratch_file(store, name, data):
+    path = store.scratch_path(name)
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+def _ref_count(db, digest):
+    return db.query(models.Blob.ref_count).filter(models.Blob.hash == digest).scalar()
+
+def test_file_digest(tmp_path):
+    path = tmp_path / "part.stl"
+    path.write_bytes(b"solid part\n")
+    assert file_digest(str(path)) == (hashlib.sha256(b"solid part\n").hexdigest(), 11)
+
+def test_acquire_and_release_count_references(db):
+    digest = hashlib.sha256(b"mesh").hexdigest()
+
+    acquire_blob(db, digest, 4)
+    acquire_blob(db, digest, 4)
+    db.commit()
+    assert _ref_count(db, digest) == 2
+
+    release_blob(db, digest)
+    db.commit()
+    assert _ref_count(db, digest) == 1
+
+def test_store_file_deduplicates(db, store):
+    first = _scratch_file(store, "first", b"G28\n")
+    second = _scratch_file(store, "second", b"G28\n")
+
+    digest, size = store_file(db, first, store=store)
+    assert store_file(db, second, store=store) == (digest, size)
+    db.commit()
+
+    assert size == 4
+    assert _ref_count(db, digest) == 2
+    assert os.path.exists(store.path_for(digest))
+    assert not os.path.exists(first) and not os.path.exists(second)
+
+def test_store_file_keeps_companions_next_to_blob(db, store):
+    path = _scratch_file(store, "job", b"G28\n")
+    index = _scratch_file(store, "job.idx.json", b"{}")
+
+    digest, _ = store_file(db, path, {index: ".idx.json"}, store=store)
+    db.commit()
+
+    assert os.path.exists(store.path_for(digest) + ".idx.json")
+    store.clear_scratch("job")
+    assert os.listdir(os.path.dirname(store.scratch_path("job"))) == []
+
+def test_collect_garbage_only_removes_unreferenced_blobs(db, store):
+    digest, _ = store_file(db, _scratch_file(store, "kept", b"kept"), store=store)
+    store_file(db, _scratch_file(store, "kept-again", b"kept"), store=store)
+    unused, _ = store_file(db, _scratch_file(store, "unused", b"unused"), {
+        _scratch_file(store, "unused.lod0.jsonl", b"[]"): ".lod0.jsonl"
+    }, store=store)
+    db.commit()
+
+    release_blob(db, digest)
+    release_blob(db, unused)
+    db.commit()
+    assert collect_garbage(db, store) == 1
+
+    assert _ref_count(db, digest) == 1
+    assert os.path.exists(store.path_for(digest))
+    assert _ref_count(db, unused) is None
+    assert not os.path.exists(store.path_for(unused))
+    assert not os.path.exists(store.path_for(unused) + ".lod0.jsonl")
+
+    release_blob(db, digest)
+    db.commit()
+    assert collect_garbage(db, store) == 1
+    assert not os.path.exists(store.path_for(digest))
+
+def test_reacquired_blob_survives_collection(db, store):
+    digest, _ = store_file(db, _scratch_file(store, "part", b"part"), store=store)
+    db.commit()
+    release_blob(db, digest)
+    db.commit()
+
+    acquire_blob(db, digest, 4)
+    db.commit()
+    assert collect_garbage(db, store) == 0
+    assert os.path.exists(store.path_for(digest))
+
+def test_blob_writer_commit_and_abort(store):
+    writer = store.writer()
+    writer.write(b"solid ")
+    writer.write(b"part\n")
+    digest, size, created = writer.commit()
+    assert (digest, size, created) == (hashlib.sha256(b"solid part\n").hexdigest(), 11, True)
+
+    duplicate = store.writer()
+    duplicate.write(b"solid part\n")
+    assert duplicate.commit()[2] is False
+
+    aborted = store.writer()
+    aborted.write(b"partial")
+    aborted.abort()
+    assert os.listdir(os.path.dirname(store.scratch_path("x"))) == []
+
+def test_path_for_rejects_non_digests(store):
+    with pytest.raises(ValueError):
+        store.path_for("../../etc/passwd")
+
+def test_slicing_the_same_model_twice_stores_one_blob(db):
+    model = models.Model(name="part", file_path="part.stl", file_type="STL")
+    db.add(model)
+    db.commit()
+
+    results = [run_slice_job(Job("slice"), model.id, f"toolpath-{i}", 2.0, 0.2) for i in range(2)]
+
+    toolpaths = db.query(models.Toolpath).filter(
+        models.Toolpath.id.in_([result["toolpath_id"] for result in results])
+    ).all()
+    assert len(toolpaths) == 2
+    assert toolpaths[0].blob_hash == toolpaths[1].blob_hash
+    assert db.query(models.Blob).count() == 1
+    assert _ref_count(db, toolpaths[0].blob_hash) == 2
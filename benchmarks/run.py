@@ -0,0 +1,327 @@
+"""
+End-to-end benchmark suite for the slicer, thermal simulator, optimizer and API
+
+    python benchmarks/run.py                                  # engine suites, small scale
+    python benchmarks/run.py --scales small medium lfam --output results.json
+    python benchmarks/run.py --baseline baseline.json         # fail on regressions
+    python benchmarks/run.py --suites api --api-url http://localhost:8000
+    python benchmarks/run.py --metrics metrics.prom           # engine phase breakdown
+
+Exits with status 1 if any metric breaks a limit in the thresholds file or
+regresses against the baseline by more than the allowed fraction.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+
+from benchmarks.synthetic import SCALES, make_toolpath_data, write_cylinder_stl
+from engine import instrumentation
+from engine.ai_copilot.ai_optimizer import AIToolpathOptimizer
+from engine.slicer.slicer import Slicer
+from engine.thermal_sim.thermal_simulator import ThermalSimulator
+
+ENGINE_SUITES = ("slicer", "thermal", "optimizer")
+ALL_SUITES = ENGINE_SUITES + ("api", "db")
+
+# Baseline values below these floors are too noisy to flag regressions on
+NOISE_FLOORS = {"_ms": 10.0, "_s": 0.01, "_mb": 1.0}
+
+# Endpoints hit by the API load test; they must be safe to call repeatedly
+API_ENDPOINTS = (
+    "/",
+    "/api/toolpaths/?project_id=1",
+    "/api/simulations/?status=completed"
+)
+
+def time_repeated(fn: Callable[[], Any], min_time_s: float = 0.2) -> float:
+    """
+    Average duration of ``fn``, repeating it until ``min_time_s`` has elapsed
+    """
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        fn()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time_s:
+            return elapsed / runs
+
+def bench_slicer(scale: Dict[str, Any], workdir: str) -> Dict[str, float]:
+    mesh_path = os.path.join(workdir, "mesh.stl")
+    mesh_bytes = write_cylinder_stl(mesh_path, scale["mesh_segments"], scale["mesh_height"])
+    slicer = Slicer({"layer_height": scale["layer_height"], "infill_density": 0.2})
+
+    start = time.perf_counter()
+    slicer.load_model(mesh_path)
+    load_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    layers = slicer.slice()
+    slice_s = time.perf_counter() - start
+
+    gcode_path = os.path.join(workdir, "part.gcode")
+    start = time.perf_counter()
+    if not slicer.generate_gcode(gcode_path):
+        raise RuntimeError("G-code generation failed")
+    gcode_s = time.perf_counter() - start
+    gcode_bytes = os.path.getsize(gcode_path)
+
+    return {
+        "mesh_bytes": mesh_bytes,
+        "layers": len(layers),
+        "gcode_bytes": gcode_bytes,
+        "load_s": load_s,
+        "slice_s": slice_s,
+        "gcode_s": gcode_s,
+        "layers_per_s": len(layers) / slice_s,
+        "gcode_mb_per_s": gcode_bytes / 1e6 / gcode_s
+    }
+
+def bench_thermal(scale: Dict[str, Any], workdir: str) -> Dict[str, float]:
+    simulator = ThermalSimulator({"time_step": 0.1})
+    simulator.initialize_grid(scale["grid_dimensions"], scale["grid_resolution"])
+    nx, ny, nz = simulator.grid.shape
+
+    add_layer_ms = []
+    for z_level in range(nz):
+        start = time.perf_counter()
+        simulator.add_layer({}, z_level)
+        add_layer_ms.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    for _ in range(scale["thermal_steps"]):
+        simulator.simulate_step()
+    simulate_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    simulator.analyze_results()
+    analyze_s = time.perf_counter() - start
+
+    # simulate_step only updates interior voxels holding material
+    material_voxels = int(np.count_nonzero(simulator.grid[1:-1, 1:-1, 1:-1]))
+    voxel_updates = material_voxels * scale["thermal_steps"]
+    return {
+        "voxels": nx * ny * nz,
+        "material_voxels": material_voxels,
+        "add_layer_ms": statistics.mean(add_layer_ms),
+        "add_layer_max_ms": max(add_layer_ms),
+        "simulate_step_ms": simulate_s / scale["thermal_steps"] * 1000,
+        "voxel_updates_per_s": voxel_updates / simulate_s,
+        "analyze_results_s": analyze_s
+    }
+
+def bench_optimizer(scale: Dict[str, Any], workdir: str) -> Dict[str, float]:
+    optimizer = AIToolpathOptimizer()
+
+    start = time.perf_counter()
+    optimizer.load_model()
+    load_s = time.perf_counter() - start
+
+    toolpath_data = make_toolpath_data(scale["optimizer_layers"], scale["layer_height"])
+    optimize_s = time_repeated(lambda: optimizer.optimize_toolpath(toolpath_data, {}))
+
+    return {
+        "layers": scale["optimizer_layers"],
+        "load_s": load_s,
+        "optimize_s": optimize_s,
+        "layers_per_s": scale["optimizer_layers"] / optimize_s
+    }
+
+def bench_api(scale: Dict[str, Any], api_url: str) -> Dict[str, float]:
+    def fetch(i: int):
+        url = api_url.rstrip("/") + API_ENDPOINTS[i % len(API_ENDPOINTS)]
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(url, timeout=30) as response:
+                response.read()
+            ok = True
+        except urllib.error.HTTPError as e:
+            ok = e.code < 500
+        except (urllib.error.URLError, OSError):
+            ok = False
+        return (time.perf_counter() - start) * 1000, ok
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=scale["api_concurrency"]) as executor:
+        samples = list(executor.map(fetch, range(scale["api_requests"])))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, _ in samples)
+    errors = sum(1 for _, ok in samples if not ok)
+    return {
+        "concurrency": scale["api_concurrency"],
+        "requests": len(samples),
+        "latency_p50_ms": statistics.median(latencies),
+        "latency_p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "latency_p99_ms": latencies[int(len(latencies) * 0.99) - 1],
+        "requests_per_s": len(samples) / elapsed,
+        "error_rate": errors / len(samples)
+    }
+
+def bench_db(scale: Dict[str, Any], workdir: str) -> Dict[str, float]:
+    # Separate process: the backend binds DATABASE_URL when it is first imported
+    output = os.path.join(workdir, "db.json")
+    database_path = os.path.join(workdir, f"bench-{scale['db_rows']}.db")
+    subprocess.run([
+        sys.executable, os.path.join(BENCHMARK_DIR, "db_queries.py"),
+        "--database-url", f"sqlite:///{database_path}",
+        "--rows", str(scale["db_rows"]),
+        "--projects", str(max(1, scale["db_rows"] // 1000)),
+        "--output", output
+    ], check=True, stdout=subprocess.DEVNULL)
+    with open(output) as f:
+        queries = json.load(f)["queries"]
+
+    metrics = {"rows": scale["db_rows"]}
+    for name, stats in queries.items():
+        metrics[f"{name}_p50_ms"] = stats["p50_ms"]
+        metrics[f"{name}_p95_ms"] = stats["p95_ms"]
+    return metrics
+
+def measure_peak_memory(fn: Callable[[], Any]) -> float:
+    """
+    Peak traced Python/NumPy allocation of a separate run of ``fn``, in MB
+
+    Run apart from the timed pass because tracing slows allocation-heavy code.
+    """
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1e6
+
+def metric_direction(name: str) -> Optional[str]:
+    """
+    Whether a larger value of a metric is better ("higher"), worse ("lower"), or neither
+    """
+    if name.endswith("_per_s"):
+        return "higher"
+    if name.endswith(("_s", "_ms", "_mb")) or name == "error_rate":
+        return "lower"
+    return None
+
+def check_thresholds(results: Dict[str, Dict[str, float]], thresholds: Dict[str, Any],
+                     baseline: Optional[Dict[str, Dict[str, float]]]) -> List[str]:
+    """
+    Compare results with absolute limits and, if given, a baseline run
+
+    Returns:
+        Human-readable failure messages; empty if everything passed
+    """
+    failures = []
+    for key, limits in thresholds.get("limits", {}).items():
+        for metric, bounds in limits.items():
+            value = results.get(key, {}).get(metric)
+            if value is None:
+                continue
+            if "min" in bounds and value < bounds["min"]:
+                failures.append(f"{key} {metric} = {value:.4g} is below the minimum {bounds['min']}")
+            if "max" in bounds and value > bounds["max"]:
+                failures.append(f"{key} {metric} = {value:.4g} is above the maximum {bounds['max']}")
+
+    if baseline:
+        max_regression = thresholds.get("max_regression", 0.25)
+        for key, metrics in results.items():
+            for metric, value in metrics.items():
+                previous = baseline.get(key, {}).get(metric)
+                direction = metric_direction(metric)
+                if previous is None or direction is None or previous <= 0:
+                    continue
+                if direction == "lower" and any(
+                    metric.endswith(suffix) and previous < floor for suffix, floor in NOISE_FLOORS.items()
+                ):
+                    continue
+                change = (previous - value) / previous if direction == "higher" else (value - previous) / previous
+                if change > max_regression:
+                    failures.append(f"{key} {metric} regressed {change:.0%} ({previous:.4g} -> {value:.4g})")
+    return failures
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=["small"])
+    parser.add_argument("--suites", nargs="+", choices=ALL_SUITES, default=list(ENGINE_SUITES))
+    parser.add_argument("--api-url", default="http://localhost:8000", help="Running backend for the api suite")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--baseline", help="Results JSON from an earlier run to compare against")
+    parser.add_argument("--thresholds", default=os.path.join(BENCHMARK_DIR, "thresholds.json"))
+    parser.add_argument("--skip-memory", action="store_true", help="Do not measure peak memory")
+    parser.add_argument("--metrics", help="Enable engine instrumentation and write Prometheus metrics to this path")
+    return parser.parse_args(argv)
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(argv)
+    engine_benchmarks = {"slicer": bench_slicer, "thermal": bench_thermal, "optimizer": bench_optimizer}
+    if args.metrics:
+        instrumentation.enable()
+
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix="nexpath-bench-") as workdir:
+        for scale_name in args.scales:
+            scale = SCALES[scale_name]
+            for suite in args.suites:
+                key = f"{suite}/{scale_name}"
+                print(f"Running {key}...", flush=True)
+                if suite in engine_benchmarks:
+                    bench = engine_benchmarks[suite]
+                    metrics = bench(scale, workdir)
+                    if not args.skip_memory:
+                        metrics["peak_memory_mb"] = measure_peak_memory(lambda: bench(scale, workdir))
+                elif suite == "api":
+                    metrics = bench_api(scale, args.api_url)
+                else:
+                    metrics = bench_db(scale, workdir)
+                results[key] = metrics
+                print("  " + ", ".join(f"{name}={value:.4g}" for name, value in metrics.items()))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform()
+        },
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.metrics:
+        with open(args.metrics, "w") as f:
+            f.write(instrumentation.registry.render_prometheus())
+
+    thresholds = {}
+    if args.thresholds and os.path.exists(args.thresholds):
+        with open(args.thresholds) as f:
+            thresholds = json.load(f)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    failures = check_thresholds(results, thresholds, baseline)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("All benchmark thresholds passed")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Synthetic inputs for the benchmark suite at several scales
+"""
+import struct
+from typing import Any, Dict
+
+import numpy as np
+
+# Workload sizes; "lfam" approximates a large-format part. Thermal grids must be
+# wider than ThermalSimulator.add_layer's 5-voxel margin on each side, or the
+# deposited disc is empty.
+SCALES: Dict[str, Dict[str, Any]] = {
+    "small": {
+        "mesh_segments": 64,
+        "mesh_height": 100.0,
+        "layer_height": 1.0,
+        "grid_dimensions": (100.0, 100.0, 20.0),
+        "grid_resolution": 2.5,
+        "thermal_steps": 20,
+        "optimizer_layers": 100,
+        "db_rows": 10_000,
+        "api_concurrency": 4,
+        "api_requests": 200
+    },
+    "medium": {
+        "mesh_segments": 1024,
+        "mesh_height": 100.0,
+        "layer_height": 0.2,
+        "grid_dimensions": (300.0, 300.0, 100.0),
+        "grid_resolution": 5.0,
+        "thermal_steps": 10,
+        "optimizer_layers": 2000,
+        "db_rows": 100_000,
+        "api_concurrency": 16,
+        "api_requests": 1000
+    },
+    "lfam": {
+        "mesh_segments": 16384,
+        "mesh_height": 100.0,
+        "layer_height": 0.05,
+        "grid_dimensions": (1000.0, 1000.0, 500.0),
+        "grid_resolution": 10.0,
+        "thermal_steps": 5,
+        "optimizer_layers": 20000,
+        "db_rows": 1_000_000,
+        "api_concurrency": 64,
+        "api_requests": 4000
+    }
+}
+
+def write_cylinder_stl(path: str, segments: int, height: float, radius: float = 50.0) -> int:
+    """
+    Write a closed cylinder as a binary STL file
+
+    Args:
+        path: Output file
+        segments: Number of facets around the circumference
+        height: Cylinder height in mm
+        radius: Cylinder radius in mm
+
+    Returns:
+        Size of the written file in bytes
+    """
+    angles = np.linspace(0.0, 2 * np.pi, segments, endpoint=False)
+    ring = np.stack([radius * np.cos(angles), radius * np.sin(angles)], axis=1)
+    next_ring = np.roll(ring, -1, axis=0)
+
+    triangles = []
+    for (x0, y0), (x1, y1) in zip(ring, next_ring):
+        bottom0, bottom1 = (x0, y0, 0.0), (x1, y1, 0.0)
+        top0, top1 = (x0, y0, height), (x1, y1, height)
+        triangles.append((bottom0, bottom1, top1))
+        triangles.append((bottom0, top1, top0))
+        triangles.append(((0.0, 0.0, 0.0), bottom1, bottom0))
+        triangles.append(((0.0, 0.0, height), top0, top1))
+
+    with open(path, "wb") as f:
+        f.write(b"NexPath synthetic benchmark mesh".ljust(80, b"\0"))
+        f.write(struct.pack("<I", len(triangles)))
+        for triangle in triangles:
+            vertices = np.asarray(triangle, dtype=np.float32)
+            normal = np.cross(vertices[1] - vertices[0], vertices[2] - vertices[0])
+            length = np.linalg.norm(normal)
+            if length > 0:
+                normal = normal / length
+            f.write(struct.pack("<12fH", *normal, *vertices.ravel(), 0))
+    return 84 + 50 * len(triangles)
+
+def make_toolpath_data(num_layers: int, layer_height: float = 0.2) -> Dict[str, Any]:
+    """
+    Toolpath description in the shape ``AIToolpathOptimizer.optimize_toolpath`` expects
+    """
+    return {
+        "layers": [{"layer_num": i, "height": layer_height} for i in range(num_layers)],
+        "print_speed": 50,
+        "temperature": 200
+    }
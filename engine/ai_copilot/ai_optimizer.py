@@ -2,6 +2,11 @@ import numpy as np
 from typing import Dict, Any, List, Tuple
 import os
 import json
+import logging
+
+from ..instrumentation import count, instrumented, timed
+
+logger = logging.getLogger(__name__)
 
 class AIToolpathOptimizer:
     def __init__(self, model_path: str = None):
@@ -15,6 +20,7 @@ class AIToolpathOptimizer:
         self.model = None
         self.loaded = False
         
+    @instrumented("optimizer", "load")
     def load_model(self):
         """
         Load the AI model for toolpath optimization
@@ -22,12 +28,12 @@ class AIToolpathOptimizer:
         try:
             # In a real implementation, this would load a PyTorch or TensorFlow model
             # Here we just simulate the process
-            print(f"Loading AI model from {self.model_path or 'default path'}")
+            logger.info("Loading AI model", extra={"model_path": self.model_path or "default path"})
             self.model = {"loaded": True, "type": "toolpath_optimizer"}
             self.loaded = True
             return True
-        except Exception as e:
-            print(f"Error loading AI model: {e}")
+        except Exception:
+            logger.exception("Error loading AI model", extra={"model_path": self.model_path})
             return False
     
     def optimize_toolpath(self, toolpath_data: Dict[str, Any], material_properties: Dict[str, Any]) -> Dict[str, Any]:
@@ -43,12 +49,22 @@ class AIToolpathOptimizer:
         """
         if not self.loaded:
             self.load_model()
-            
+        
+        with timed("optimizer", "inference"):
+            optimized_data = self._run_inference(toolpath_data, material_properties)
+        count("nexpath_optimizer_layers_total", len(optimized_data.get("layers", [])))
+        return optimized_data
+    
+    def _run_inference(self, toolpath_data: Dict[str, Any], material_properties: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run the model over a toolpath; split from ``optimize_toolpath`` so the
+        inference phase is timed without the lazy model load
+        """
         # In a real implementation, this would run the data through the AI model
         # Here we just simulate some optimizations
         
         # Simulate optimization process
-        print("Running AI optimization on toolpath...")
+        logger.debug("Running AI optimization on toolpath", extra={"layers": len(toolpath_data.get("layers", []))})
         
         # Copy the original data
         optimized_data = toolpath_data.copy()
@@ -140,6 +156,6 @@ class AIToolpathOptimizer:
             with open(output_path, 'w') as f:
                 json.dump(optimized_data, f, indent=2)
             return True
-        except Exception as e:
-            print(f"Error saving optimization: {e}")
+        except Exception:
+            logger.exception("Error saving optimization", extra={"output_path": output_path})
             return False
\ No newline at end of file
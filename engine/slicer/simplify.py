@@ -0,0 +1,73 @@
+import math
+from typing import List, Sequence, Tuple
+
+Point = Tuple[float, float]
+
+def douglas_peucker(points: Sequence[Point], tolerance: float) -> List[Point]:
+    """
+    Simplify a polyline with the Douglas-Peucker algorithm
+
+    Works on plain tuples: slicer paths are short (tens to a few thousand
+    points), where per-call NumPy overhead costs more than the arithmetic.
+
+    Args:
+        points: Polyline vertices as (x, y) pairs
+        tolerance: Maximum allowed distance in mm between the original
+            polyline and its simplification
+
+    Returns:
+        The retained vertices; the end points are always kept
+    """
+    if len(points) < 3:
+        return list(points)
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+
+    # Iterative to avoid recursion limits on long contours
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        x0, y0 = points[start]
+        dx, dy = points[end][0] - x0, points[end][1] - y0
+        length = math.hypot(dx, dy)
+
+        max_distance, split = -1.0, start
+        for i in range(start + 1, end):
+            px, py = points[i][0] - x0, points[i][1] - y0
+            if length == 0:
+                # Closed loop: measure distance to the shared end point
+                distance = math.hypot(px, py)
+            else:
+                distance = abs(dx * py - dy * px) / length
+            if distance > max_distance:
+                max_distance, split = distance, i
+
+        if max_distance > tolerance:
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+def simplify_layer(layer: dict, tolerance: float, precision: int = 3) -> List[List[Point]]:
+    """
+    Build simplified preview polylines for one sliced layer
+
+    Args:
+        layer: Layer data as produced by ``Slicer.slice``
+        tolerance: Douglas-Peucker tolerance in mm; 0 only drops vertices
+            that lie exactly on the line between their neighbours
+        precision: Decimal places kept in the output coordinates
+
+    Returns:
+        List of polylines; contours are closed by repeating their first point
+    """
+    polylines = [contour + [contour[0]] for contour in layer["contours"]] + list(layer["infill"])
+    polylines = [douglas_peucker(polyline, tolerance) for polyline in polylines]
+
+    return [[(round(float(x), precision), round(float(y), precision)) for x, y in polyline]
+            for polyline in polylines]
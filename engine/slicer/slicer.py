@@ -1,8 +1,22 @@
 import numpy as np
-from typing import List, Dict, Any, Tuple
+import json
+import logging
+from contextlib import ExitStack
+from typing import List, Dict, Any, Tuple, Callable, Optional
+
+from ..instrumentation import count, instrumented, timed
+from .simplify import simplify_layer
+
+logger = logging.getLogger(__name__)
+
+# Douglas-Peucker tolerances (mm) for the preview levels of detail, finest first.
+# Contours are sampled every 10 degrees, so at the 50 mm outer radius a
+# tolerance must exceed the 0.76 mm sagitta of a 20 degree arc before any
+# vertex is dropped.
+DEFAULT_PREVIEW_TOLERANCES = (0.0, 1.0, 5.0)
 
 class Slicer:
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None):
         """
         Initialize the slicer with configuration parameters
         
@@ -12,11 +26,16 @@ class Slicer:
                 - infill_density: Percentage of infill (0.0 to 1.0)
                 - wall_thickness: Thickness of outer walls in mm
                 - print_speed: Print speed in mm/s
+            progress_callback: Optional callable receiving a progress event
+                dict after each sliced layer. Exceptions raised by the
+                callback abort slicing, which is how callers cancel a job.
         """
         self.config = config
+        self.progress_callback = progress_callback
         self.model = None
         self.layers = []
         
+    @instrumented("slicer", "load")
     def load_model(self, file_path: str) -> bool:
         """
         Load a 3D model from file
@@ -30,13 +49,14 @@ class Slicer:
         try:
             # In a real implementation, we would use a library like numpy-stl or trimesh
             # to load the actual 3D model
-            print(f"Loading model from {file_path}")
+            logger.info("Loading model", extra={"file_path": file_path})
             self.model = {"path": file_path, "loaded": True}
             return True
-        except Exception as e:
-            print(f"Error loading model: {e}")
+        except Exception:
+            logger.exception("Error loading model", extra={"file_path": file_path})
             return False
     
+    @instrumented("slicer", "slice")
     def slice(self) -> List[Dict[str, Any]]:
         """
         Slice the loaded model into layers
@@ -57,15 +77,26 @@ class Slicer:
         
         for i in range(num_layers):
             z_height = i * layer_height
-            # Simulate layer contours and paths
-            layer = {
-                "layer_num": i,
-                "z_height": z_height,
-                "contours": self._generate_dummy_contours(z_height),
-                "infill": self._generate_dummy_infill(z_height)
-            }
+            with timed("slicer", "layer"):
+                # Simulate layer contours and paths
+                layer = {
+                    "layer_num": i,
+                    "z_height": z_height,
+                    "contours": self._generate_dummy_contours(z_height),
+                    "infill": self._generate_dummy_infill(z_height)
+                }
             self.layers.append(layer)
             
+            if self.progress_callback:
+                self.progress_callback({
+                    "type": "progress",
+                    "stage": "slice",
+                    "layer": i + 1,
+                    "total_layers": num_layers,
+                    "z_height": z_height
+                })
+        
+        count("nexpath_slicer_layers_total", num_layers)
         return self.layers
     
     def _generate_dummy_contours(self, z_height: float) -> List[List[Tuple[float, float]]]:
@@ -110,10 +141,21 @@ class Slicer:
             
         return lines
     
+    @instrumented("slicer", "gcode_write")
     def generate_gcode(self, output_path: str) -> bool:
         """
         Generate G-code from the sliced layers
         
+        Next to the G-code this writes a byte-offset index of every layer
+        (see ``layer_index_path``) so a single layer can be read with one seek,
+        and one preview file per level of detail (see ``preview_path``) with
+        the layer paths simplified at the tolerances in the
+        ``preview_tolerances`` config entry (mm, finest first).
+        
+        The G-code depends only on the layers and the config, so identical
+        slicing inputs give byte-identical files that share one stored blob;
+        the generation time is recorded in the index instead.
+        
         Args:
             output_path: Path to save the G-code file
             
@@ -124,64 +166,138 @@ class Slicer:
             raise ValueError("No sliced layers available")
             
         try:
-            with open(output_path, 'w') as f:
-                # Write G-code header
-                f.write("; NexPath LFAM G-code\n")
-                f.write(f"; Generated on {np.datetime64('now')}\n")
-                f.write(f"; Layer height: {self.config.get('layer_height', 0.2)}mm\n")
-                f.write(f"; Infill density: {self.config.get('infill_density', 0.2) * 100}%\n")
-                f.write("\n")
+            tolerances = [float(t) for t in self.config.get("preview_tolerances", DEFAULT_PREVIEW_TOLERANCES)]
+            index = {
+                "version": 1,
+                "generated_at": str(np.datetime64('now')),
+                "preview_tolerances": tolerances,
+                "layers": []
+            }
+            preview_offsets = [0] * len(tolerances)
+            
+            with ExitStack() as stack:
+                f = stack.enter_context(open(output_path, 'wb'))
+                previews = [stack.enter_context(open(preview_path(output_path, lod), 'wb'))
+                            for lod in range(len(tolerances))]
                 
-                # Initialize
-                f.write("G28 ; Home all axes\n")
-                f.write("G90 ; Use absolute coordinates\n")
-                f.write("M82 ; Use absolute distances for extrusion\n")
-                f.write("M140 S60 ; Set bed temperature\n")
-                f.write("M190 S60 ; Wait for bed temperature\n")
-                f.write("M104 S200 ; Set extruder temperature\n")
-                f.write("M109 S200 ; Wait for extruder temperature\n")
-                f.write("G92 E0 ; Reset extruder position\n")
-                f.write("G1 Z0.2 F3000 ; Move to start position\n")
-                f.write("G1 X0 Y0 F3000 ; Move to start position\n")
-                f.write("\n")
+                offset = f.write(self._gcode_header().encode())
                 
-                # Process each layer
+                # Process each layer, recording where it starts in the file
                 for layer in self.layers:
-                    f.write(f"; Layer {layer['layer_num']}, Z = {layer['z_height']}\n")
-                    f.write(f"G1 Z{layer['z_height']} F3000 ; Move to layer height\n")
+                    data = self._layer_gcode(layer).encode()
+                    f.write(data)
+                    entry = {
+                        "layer": layer['layer_num'],
+                        "z": layer['z_height'],
+                        "offset": offset,
+                        "length": len(data),
+                        "preview": []
+                    }
+                    offset += len(data)
                     
-                    # Process contours
-                    for contour in layer['contours']:
-                        # Move to first point without extruding
-                        first_point = contour[0]
-                        f.write(f"G1 X{first_point[0]} Y{first_point[1]} F3000 ; Move to contour start\n")
-                        f.write("G1 E0.5 F1500 ; Prime extruder\n")
-                        
-                        # Trace contour
-                        for point in contour[1:] + [contour[0]]:  # Close the loop
-                            f.write(f"G1 X{point[0]} Y{point[1]} E1 F1500 ; Contour\n")
+                    for lod, tolerance in enumerate(tolerances):
+                        preview = {
+                            "layer": layer['layer_num'],
+                            "z": layer['z_height'],
+                            "polylines": simplify_layer(layer, tolerance)
+                        }
+                        line = (json.dumps(preview, separators=(",", ":")) + "\n").encode()
+                        previews[lod].write(line)
+                        entry["preview"].append([preview_offsets[lod], len(line)])
+                        preview_offsets[lod] += len(line)
                     
-                    # Process infill
-                    f.write("G1 E-0.5 F1800 ; Retract\n")
-                    for line in layer['infill']:
-                        # Move to line start
-                        f.write(f"G1 X{line[0][0]} Y{line[0][1]} F3000 ; Move to infill line\n")
-                        f.write("G1 E0.5 F1500 ; Prime extruder\n")
-                        
-                        # Draw line
-                        f.write(f"G1 X{line[1][0]} Y{line[1][1]} E1 F1500 ; Infill\n")
-                        f.write("G1 E-0.5 F1800 ; Retract\n")
-                
-                # End G-code
-                f.write("\n")
-                f.write("G1 E-2 F1800 ; Retract\n")
-                f.write("G1 Z" + str(self.layers[-1]['z_height'] + 10) + " F3000 ; Move Z up\n")
-                f.write("G1 X0 Y0 F3000 ; Move to origin\n")
-                f.write("M104 S0 ; Turn off extruder\n")
-                f.write("M140 S0 ; Turn off bed\n")
-                f.write("M84 ; Disable motors\n")
+                    index["layers"].append(entry)
                 
+                offset += f.write(self._gcode_footer().encode())
+                index["gcode_size"] = offset
+            
+            with open(layer_index_path(output_path), 'w') as f:
+                json.dump(index, f, separators=(",", ":"))
+            
+            count("nexpath_slicer_gcode_bytes_total", offset)
             return True
-        except Exception as e:
-            print(f"Error generating G-code: {e}")
-            return False
\ No newline at end of file
+        except Exception:
+            logger.exception("Error generating G-code", extra={"output_path": output_path})
+            return False
+    
+    def _gcode_header(self) -> str:
+        """
+        G-code preamble: metadata comments, homing and heating
+        """
+        return "".join([
+            "; NexPath LFAM G-code\n",
+            f"; Layer height: {self.config.get('layer_height', 0.2)}mm\n",
+            f"; Infill density: {self.config.get('infill_density', 0.2) * 100}%\n",
+            "\n",
+            # Initialize
+            "G28 ; Home all axes\n",
+            "G90 ; Use absolute coordinates\n",
+            "M82 ; Use absolute distances for extrusion\n",
+            "M140 S60 ; Set bed temperature\n",
+            "M190 S60 ; Wait for bed temperature\n",
+            "M104 S200 ; Set extruder temperature\n",
+            "M109 S200 ; Wait for extruder temperature\n",
+            "G92 E0 ; Reset extruder position\n",
+            "G1 Z0.2 F3000 ; Move to start position\n",
+            "G1 X0 Y0 F3000 ; Move to start position\n",
+            "\n"
+        ])
+    
+    def _layer_gcode(self, layer: Dict[str, Any]) -> str:
+        """
+        G-code for a single layer, starting with its "; Layer N" comment
+        """
+        lines = [
+            f"; Layer {layer['layer_num']}, Z = {layer['z_height']}\n",
+            f"G1 Z{layer['z_height']} F3000 ; Move to layer height\n"
+        ]
+        
+        # Process contours
+        for contour in layer['contours']:
+            # Move to first point without extruding
+            first_point = contour[0]
+            lines.append(f"G1 X{first_point[0]} Y{first_point[1]} F3000 ; Move to contour start\n")
+            lines.append("G1 E0.5 F1500 ; Prime extruder\n")
+            
+            # Trace contour
+            for point in contour[1:] + [contour[0]]:  # Close the loop
+                lines.append(f"G1 X{point[0]} Y{point[1]} E1 F1500 ; Contour\n")
+        
+        # Process infill
+        lines.append("G1 E-0.5 F1800 ; Retract\n")
+        for line in layer['infill']:
+            # Move to line start
+            lines.append(f"G1 X{line[0][0]} Y{line[0][1]} F3000 ; Move to infill line\n")
+            lines.append("G1 E0.5 F1500 ; Prime extruder\n")
+            
+            # Draw line
+            lines.append(f"G1 X{line[1][0]} Y{line[1][1]} E1 F1500 ; Infill\n")
+            lines.append("G1 E-0.5 F1800 ; Retract\n")
+        
+        return "".join(lines)
+    
+    def _gcode_footer(self) -> str:
+        """
+        G-code epilogue: retract, park and switch off heaters and motors
+        """
+        return "".join([
+            "\n",
+            "G1 E-2 F1800 ; Retract\n",
+            "G1 Z" + str(self.layers[-1]['z_height'] + 10) + " F3000 ; Move Z up\n",
+            "G1 X0 Y0 F3000 ; Move to origin\n",
+            "M104 S0 ; Turn off extruder\n",
+            "M140 S0 ; Turn off bed\n",
+            "M84 ; Disable motors\n"
+        ])
+
+def layer_index_path(gcode_path: str) -> str:
+    """
+    Path of the per-layer byte-offset index written next to a G-code file
+    """
+    return gcode_path + ".idx.json"
+
+def preview_path(gcode_path: str, lod: int) -> str:
+    """
+    Path of the preview polylines for one level of detail (0 = finest)
+    """
+    return f"{gcode_path}.lod{lod}.jsonl"
@@ -1,10 +1,18 @@
 import numpy as np
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Callable, Optional
 import os
 import json
+import logging
+
+from ..instrumentation import count, instrumented
+
+logger = logging.getLogger(__name__)
+
+# Per-step temperature fields recorded in the simulation history
+HISTORY_FIELDS = ("time", "max_temp", "min_temp", "avg_temp")
 
 class ThermalSimulator:
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None):
         """
         Initialize the thermal simulator
         
@@ -13,11 +21,16 @@ class ThermalSimulator:
                 - resolution: Grid resolution in mm
                 - time_step: Simulation time step in seconds
                 - material: Material properties dictionary
+                - progress_interval: Steps between temperature summary events
+            progress_callback: Optional callable receiving a temperature
+                summary event every ``progress_interval`` steps
         """
         self.config = config
+        self.progress_callback = progress_callback
         self.grid = None
         self.temperature = None
         self.time = 0.0
+        self.step_count = 0
         self.history = []
         
     def initialize_grid(self, dimensions: Tuple[float, float, float], resolution: float) -> None:
@@ -40,8 +53,9 @@ class ThermalSimulator:
         # Initialize material grid (0 = air, 1 = material)
         self.grid = np.zeros((nx, ny, nz))
         
-        print(f"Initialized grid with dimensions {self.grid.shape}")
+        logger.info("Initialized grid", extra={"grid_shape": list(self.grid.shape), "resolution": resolution})
         
+    @instrumented("thermal", "add_layer")
     def add_layer(self, layer_data: Dict[str, Any], z_level: int) -> None:
         """
         Add a printed layer to the simulation
@@ -71,6 +85,7 @@ class ThermalSimulator:
                     extrusion_temp = self.config.get("extrusion_temperature", 200.0)
                     self.temperature[i, j, z_level] = extrusion_temp
         
+    @instrumented("thermal", "simulate_step")
     def simulate_step(self) -> None:
         """
         Simulate one time step of thermal diffusion
@@ -137,15 +152,31 @@ class ThermalSimulator:
         
         # Update simulation time
         self.time += time_step
+        self.step_count += 1
+        count("nexpath_thermal_steps_total")
         
         # Save history (downsampled for efficiency)
         if len(self.history) % 10 == 0:  # Save every 10th step
-            self.history.append({
-                "time": self.time,
-                "max_temp": float(np.max(self.temperature)),
-                "min_temp": float(np.min(self.temperature)),
-                "avg_temp": float(np.mean(self.temperature[self.grid > 0])) if np.any(self.grid > 0) else ambient_temp
-            })
+            self.history.append(self._temperature_summary(ambient_temp))
+        
+        # Report a temperature summary to the caller at the configured interval
+        progress_interval = self.config.get("progress_interval", 10)
+        if self.progress_callback and self.step_count % progress_interval == 0:
+            summary = self._temperature_summary(ambient_temp)
+            summary.update({"type": "temperature", "step": self.step_count})
+            self.progress_callback(summary)
+    
+    def _temperature_summary(self, ambient_temp: float) -> Dict[str, Any]:
+        """
+        Summarize the current temperature field over deposited material
+        """
+        material_mask = self.grid > 0
+        return {
+            "time": self.time,
+            "max_temp": float(np.max(self.temperature)),
+            "min_temp": float(np.min(self.temperature)),
+            "avg_temp": float(np.mean(self.temperature[material_mask])) if np.any(material_mask) else ambient_temp
+        }
     
     def run_simulation(self, num_steps: int) -> Dict[str, Any]:
         """
@@ -165,6 +196,7 @@ class ThermalSimulator:
         
         return results
     
+    @instrumented("thermal", "analyze_results")
     def analyze_results(self) -> Dict[str, Any]:
         """
         Analyze the simulation results
@@ -232,6 +264,10 @@ class ThermalSimulator:
         """
         Save simulation results to a file
         
+        The JSON file is written compactly, and a columnar copy is written
+        next to it (see ``columnar_results_path``) so clients can load the
+        temperature history without parsing JSON.
+        
         Args:
             results: Simulation results to save
             output_path: Path to save the results
@@ -242,8 +278,34 @@ class ThermalSimulator:
         try:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             with open(output_path, 'w') as f:
-                json.dump(results, f, indent=2)
+                json.dump(results, f, separators=(",", ":"))
+            self.save_results_columnar(results, columnar_results_path(output_path))
             return True
-        except Exception as e:
-            print(f"Error saving simulation results: {e}")
-            return False
\ No newline at end of file
+        except Exception:
+            logger.exception("Error saving simulation results", extra={"output_path": output_path})
+            return False
+    
+    def save_results_columnar(self, results: Dict[str, Any], output_path: str) -> None:
+        """
+        Save simulation results as a compressed NumPy archive
+        
+        Each history field is stored as its own float array; everything else
+        is stored as a JSON string under ``summary``.
+        
+        Args:
+            results: Simulation results to save
+            output_path: Path of the .npz file
+        """
+        history = results.get("history", [])
+        columns = {
+            field: np.array([entry[field] for entry in history], dtype=np.float64)
+            for field in HISTORY_FIELDS
+        }
+        summary = {key: value for key, value in results.items() if key != "history"}
+        np.savez_compressed(output_path, summary=np.array(json.dumps(summary)), **columns)
+
+def columnar_results_path(output_path: str) -> str:
+    """
+    Path of the columnar copy written alongside a JSON results file
+    """
+    return os.path.splitext(output_path)[0] + ".npz"
\ No newline at end of file